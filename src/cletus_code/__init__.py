@@ -2,32 +2,36 @@
 
 __version__ = "0.4.0"
 
-# Import main functions for easier access
-from .process_review import (
-    load_review_data,
-    validate_review,
-    build_markdown,
-    load_pull_request,
-    derive_labels,
-    apply_labels,
-    publish_comment,
-    approve_and_merge,
-    main as process_review_main,
-)
-from .run_review import ReviewOrchestrator, main as run_review_main
+# Public API, resolved lazily so importing a submodule (or running one with
+# ``python -m``) does not pull in PyGithub, Jinja2 and jsonschema up front
+_LAZY_EXPORTS = {
+    "load_review_data": ("process_review", "load_review_data"),
+    "validate_review": ("process_review", "validate_review"),
+    "build_markdown": ("process_review", "build_markdown"),
+    "load_pull_request": ("process_review", "load_pull_request"),
+    "derive_labels": ("process_review", "derive_labels"),
+    "apply_labels": ("process_review", "apply_labels"),
+    "publish_comment": ("process_review", "publish_comment"),
+    "approve_and_merge": ("process_review", "approve_and_merge"),
+    "process_review_main": ("process_review", "main"),
+    "ReviewOrchestrator": ("run_review", "ReviewOrchestrator"),
+    "run_review_main": ("run_review", "main"),
+}
 
-__all__ = [
-    "load_review_data",
-    "validate_review",
-    "build_markdown",
-    "load_pull_request",
-    "derive_labels",
-    "apply_labels",
-    "publish_comment",
-    "approve_and_merge",
-    "process_review_main",
-    "ReviewOrchestrator",
-    "run_review_main",
-]
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import public API members on first access."""
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
 # Test comment
 # Another test
@@ -7,6 +7,7 @@ with more reliable Python code.
 
 import json
 import os
+import shutil
 import sys
 from pathlib import Path
 from typing import Optional
@@ -293,7 +294,6 @@ def write_structured_output_from_env(
             # Fallback: check workspace
             workspace_review = workspace_path / output_dir / "review.json"
             if workspace_review.exists():
-                import shutil
                 output_path.mkdir(parents=True, exist_ok=True)
                 shutil.copy(workspace_review, output_path / "review.json")
                 logger.info("copied_from_workspace", src=str(workspace_review))
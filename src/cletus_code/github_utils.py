@@ -1,10 +1,14 @@
 """GitHub API utilities for file fetching and repository operations."""
 
+import base64
+import functools
 import json
 import logging
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
+from urllib.parse import quote
 
 from github import Github
 from github.GithubException import GithubException
@@ -45,8 +49,6 @@ def fetch_file_from_github(
         if hasattr(contents, "decoded_content"):
             return contents.decoded_content.decode("utf-8")
         elif hasattr(contents, "content"):
-            import base64
-
             return base64.b64decode(contents.content).decode("utf-8")
         else:
             return None
@@ -59,6 +61,105 @@ def fetch_file_from_github(
         return None
 
 
+def fetch_file_from_github_conditional(
+    repository: str,
+    path: str,
+    token: str,
+    ref: str = "main",
+    etag: Optional[str] = None,
+) -> tuple[int, Optional[str], Optional[str]]:
+    """Fetch a file from a GitHub repository unless it still matches an ETag.
+
+    A 304 Not Modified answer carries no body and does not count against the
+    primary rate limit, so revalidating a cached file is nearly free.
+
+    Args:
+        repository: Repository name (e.g., "owner/repo").
+        path: Path to the file in the repository.
+        token: GitHub token for authentication.
+        ref: Git ref (branch, tag, or commit).
+        etag: ETag of the cached copy, if any.
+
+    Returns:
+        Tuple of (status, etag, content). Status is 304 when the cached copy is
+        still current, 200 with the new ETag and content when it changed, and
+        the error status (0 if the request failed outright) otherwise.
+    """
+    headers = {"Accept": "application/vnd.github.raw+json"}
+    if etag:
+        headers["If-None-Match"] = etag
+
+    try:
+        gh = Github(token)
+        status, response_headers, body = gh.requester.requestJson(
+            "GET",
+            f"/repos/{repository}/contents/{quote(path)}",
+            parameters={"ref": ref},
+            headers=headers,
+        )
+    except Exception as e:
+        logger.warning(f"Unexpected error fetching {repository}/{path}: {e}")
+        return 0, None, None
+
+    if status == 200:
+        return status, response_headers.get("etag"), body
+    if status != 304:
+        logger.debug(f"GitHub API error fetching {repository}/{path}: {status}")
+    return status, None, None
+
+
+def fetch_files_from_github(
+    repository: str,
+    files: list[tuple[str, str]],
+    token: str,
+) -> Optional[list[Optional[str]]]:
+    """Fetch several files from one repository with a single GraphQL query.
+
+    Args:
+        repository: Repository name (e.g., "owner/repo").
+        files: (ref, path) pairs to fetch.
+        token: GitHub token for authentication.
+
+    Returns:
+        File contents in the order of files (None for missing or binary files),
+        or None if the query failed and callers should fetch file by file.
+    """
+    owner, _, name = repository.partition("/")
+    # One aliased object lookup per file; expressions are passed as variables
+    params = "".join(f", $e{i}: String!" for i in range(len(files)))
+    fields = " ".join(
+        f"f{i}: object(expression: $e{i}) {{ ... on Blob {{ text isTruncated }} }}"
+        for i in range(len(files))
+    )
+    query = (
+        f"query($owner: String!, $name: String!{params}) "
+        f"{{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+    )
+    variables = {"owner": owner, "name": name}
+    variables.update({f"e{i}": f"{ref}:{path}" for i, (ref, path) in enumerate(files)})
+
+    try:
+        gh = Github(token)
+        _, data = gh.requester.graphql_query(query, variables)
+        repo = data["data"]["repository"]
+    except Exception as e:
+        logger.debug(f"GraphQL file lookup failed for {repository}: {e}")
+        return None
+
+    if not repo:
+        return None
+
+    contents: list[Optional[str]] = []
+    for i, (ref, path) in enumerate(files):
+        blob = repo.get(f"f{i}") or {}
+        if blob.get("isTruncated"):
+            # GraphQL caps blob text; large files still come through the contents API
+            contents.append(fetch_file_from_github(repository, path, token, ref))
+        else:
+            contents.append(blob.get("text"))
+    return contents
+
+
 def get_pull_request_context(
     token: str,
     repository: str,
@@ -111,6 +212,158 @@ def get_pull_request_context(
     }
 
 
+# Everything get_pull_request_context + resolve_rebase_refs need, in one round trip
+_PULL_REQUEST_REFS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      baseRefOid
+      headRefOid
+      mergeCommit { oid parents(first: 2) { nodes { oid } } }
+      potentialMergeCommit { oid parents(first: 2) { nodes { oid } } }
+    }
+  }
+}
+"""
+
+
+def get_pull_request_refs(
+    token: str,
+    repository: str,
+    pr_number: int,
+) -> Optional[tuple[str, str]]:
+    """Resolve base and head SHAs for a PR with a single GraphQL query.
+
+    Applies the same rebase resolution as resolve_rebase_refs: when the merge
+    commit has two parents they are used as (base, head).
+
+    Args:
+        token: GitHub token.
+        repository: Repository name (e.g., "owner/repo").
+        pr_number: Pull request number.
+
+    Returns:
+        Tuple of (base_sha, head_sha), or None if the query failed or the REST
+        path is needed (single-parent merge commits require a head existence check).
+    """
+    owner, _, name = repository.partition("/")
+    try:
+        gh = Github(token)
+        _, data = gh.requester.graphql_query(
+            _PULL_REQUEST_REFS_QUERY,
+            {"owner": owner, "name": name, "number": pr_number},
+        )
+        pr = data["data"]["repository"]["pullRequest"]
+    except Exception as e:
+        logger.debug(f"GraphQL PR lookup failed for {repository}#{pr_number}: {e}")
+        return None
+
+    if not pr or not pr.get("headRefOid"):
+        return None
+
+    merge = pr.get("mergeCommit") or pr.get("potentialMergeCommit")
+    if not merge:
+        return pr["baseRefOid"], pr["headRefOid"]
+
+    parents = [node["oid"] for node in merge["parents"]["nodes"]]
+    if len(parents) >= 2:
+        # First parent is base, second is head
+        return parents[0], parents[1]
+
+    return None
+
+
+# Comment and approval in one request. Mutation fields run in order but each on
+# its own: a failed field comes back null next to the others' results.
+_COMMENT_AND_APPROVE_MUTATION = """
+mutation($id: ID!, $comment: String!, $approval: String!, $withComment: Boolean!) {
+  comment: addComment(input: {subjectId: $id, body: $comment}) @include(if: $withComment) {
+    clientMutationId
+  }
+  approve: addPullRequestReview(input: {pullRequestId: $id, event: APPROVE, body: $approval}) {
+    pullRequestReview { state }
+  }
+}
+"""
+
+# Sent only once the approval is confirmed, so a PR is never merged unapproved
+_MERGE_MUTATION = """
+mutation($id: ID!) {
+  merge: mergePullRequest(input: {pullRequestId: $id, mergeMethod: MERGE}) {
+    pullRequest { merged }
+  }
+}
+"""
+
+
+@dataclass
+class PublishAndMergeResult:
+    """What publish_and_merge_pull_request got done, so a fallback can finish the rest."""
+
+    commented: bool = False
+    approved: bool = False
+    merged: bool = False
+
+
+def publish_and_merge_pull_request(
+    token: str,
+    pr_node_id: str,
+    comment_body: Optional[str],
+    approval_body: str,
+) -> PublishAndMergeResult:
+    """Comment on and approve a PR in one GraphQL request, then merge it.
+
+    The merge is a second request, sent only if the approval went through.
+
+    Args:
+        token: GitHub token.
+        pr_node_id: GraphQL node ID of the pull request.
+        comment_body: Review comment to post, or None to skip the comment.
+        approval_body: Body of the approving review.
+
+    Returns:
+        Which of comment, approval and merge succeeded. Failed steps are left
+        for the caller; an approval that succeeded must not be repeated.
+    """
+    result = PublishAndMergeResult()
+    gh = Github(token)
+
+    try:
+        # Not graphql_query: it raises on any error and drops the fields that succeeded
+        _, data = gh.requester.requestJsonAndCheck(
+            "POST",
+            gh.requester.graphql_url,
+            input={
+                "query": _COMMENT_AND_APPROVE_MUTATION,
+                "variables": {
+                    "id": pr_node_id,
+                    "comment": comment_body or "",
+                    "approval": approval_body,
+                    "withComment": comment_body is not None,
+                },
+            },
+        )
+    except Exception as e:
+        logger.warning(f"GraphQL comment and approval failed for {pr_node_id}: {e}")
+        return result
+
+    fields = data.get("data") or {}
+    result.commented = fields.get("comment") is not None
+    result.approved = (fields.get("approve") or {}).get("pullRequestReview") is not None
+    if data.get("errors"):
+        logger.warning(f"GraphQL comment and approval reported errors for {pr_node_id}: {data['errors']}")
+    if not result.approved:
+        return result
+
+    try:
+        _, data = gh.requester.graphql_query(_MERGE_MUTATION, {"id": pr_node_id})
+        result.merged = bool(data["data"]["merge"]["pullRequest"]["merged"])
+    except Exception as e:
+        logger.warning(f"GraphQL merge failed for {pr_node_id}: {e}")
+
+    return result
+
+
 def resolve_rebase_refs(
     token: str,
     repository: str,
@@ -167,21 +420,49 @@ def resolve_rebase_refs(
     return base_sha, head_sha
 
 
-def _resolve_pr_number() -> int:
+@functools.lru_cache(maxsize=4)
+def _parse_event_file(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse an event file; mtime and size only serve as cache keys."""
+    with open(path, "rb") as fh:
+        return json.load(fh)
+
+
+def _load_event(path: str | Path) -> dict[str, Any]:
+    """Load the GitHub event payload, parsing each file version only once.
+
+    The returned dict is shared between callers and must not be mutated.
+
+    Args:
+        path: Path to the event JSON file.
+
+    Returns:
+        Parsed event payload.
+    """
+    stat = os.stat(path)
+    return _parse_event_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _resolve_pr_number(env: Optional[Mapping[str, str]] = None) -> int:
     """Resolve PR number from environment variables.
 
     Checks:
     1. REVIEW_PR_NUMBER (manual override)
     2. GITHUB_EVENT_PATH (event payload)
 
+    Args:
+        env: Environment to read; defaults to os.environ.
+
     Returns:
         Pull request number.
 
     Raises:
         ValueError: If PR number cannot be determined.
     """
+    if env is None:
+        env = os.environ
+
     # Check for manual override
-    override = os.environ.get("REVIEW_PR_NUMBER")
+    override = env.get("REVIEW_PR_NUMBER")
     if override:
         try:
             return int(override)
@@ -189,16 +470,16 @@ def _resolve_pr_number() -> int:
             raise ValueError(f"Invalid REVIEW_PR_NUMBER: {override}")
 
     # Check event payload
-    event_path = os.environ.get("GITHUB_EVENT_PATH")
+    event_path = env.get("GITHUB_EVENT_PATH")
     if not event_path:
         raise ValueError("GITHUB_EVENT_PATH not set")
 
-    event_file = Path(event_path)
-    if not event_file.exists():
+    # _load_event stats the file anyway, so let a missing file surface from there
+    try:
+        event = _load_event(event_path)
+    except FileNotFoundError:
         raise ValueError(f"Event file not found: {event_path}")
 
-    event = json.loads(event_file.read_text())
-
     # Try various fields where PR number might be
     for key in ["number", "pull_request"]:
         value = event.get(key)
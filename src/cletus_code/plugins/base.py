@@ -14,7 +14,8 @@ class PluginContext:
     repository: str
     github_token: str
 
-    # Paths to checkout directories
+    # Paths to checkout directories; base_dir is only populated once a plugin
+    # has detected changes, so detects() must not rely on it
     workspace_root: Path
     pr_dir: Path
     base_dir: Path
@@ -1,7 +1,6 @@
 """Kustomize plugin for generating Kubernetes manifest diffs."""
 
 import logging
-import os
 import subprocess
 from pathlib import Path
 
@@ -163,23 +162,23 @@ class KustomizePlugin(Plugin):
 
             logger.info(f"Rendering kustomize directory: {full_dir}")
 
-            # Run kubectl kustomize
-            result = subprocess.run(
-                ["kubectl", "kustomize", str(full_dir), "--enable-helm"],
-                capture_output=True,
-                text=True,
-                check=False,
-                env=os.environ.copy(),
-            )
-
-            if result.returncode != 0:
-                logger.error(f"kubectl kustomize failed for {full_dir}: {result.stderr}")
-                raise subprocess.CalledProcessError(result.returncode, result.args, result.stderr)
-
-            # Append to output file with separator
+            # Run kubectl kustomize, streaming the manifests straight into the
+            # output file after the separator; only stderr is read back
             with open(output_file, "a") as f:
                 f.write(f"# --- {dir_path} ---\n")
-                f.write(result.stdout)
+                f.flush()
+                result = subprocess.run(
+                    ["kubectl", "kustomize", str(full_dir), "--enable-helm"],
+                    stdout=f,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    check=False,
+                )
+
+                if result.returncode != 0:
+                    logger.error(f"kubectl kustomize failed for {full_dir}: {result.stderr}")
+                    raise subprocess.CalledProcessError(result.returncode, result.args, result.stderr)
+
                 f.write("\n")
 
     def _generate_diff(self, base_file: Path, pr_file: Path) -> str:
@@ -212,19 +211,12 @@ class KustomizePlugin(Plugin):
         Returns:
             Markdown formatted comment.
         """
-        lines = ["## Kustomize Diff Preview", ""]
-
         if not dirs:
-            lines.append("No renderable kustomize directories found.")
+            summary = "No renderable kustomize directories found."
         else:
-            lines.append(f"Rendered {len(dirs)} kustomize directory(ies)")
-
-        lines.append("")
-        lines.append("```diff")
-        lines.append(diff)
-        lines.append("```")
+            summary = f"Rendered {len(dirs)} kustomize directory(ies)"
 
-        return "\n".join(lines)
+        return f"## Kustomize Diff Preview\n\n{summary}\n\n```diff\n{diff}\n```"
 
     def _build_review_context(self, diff: str, dirs: list[str]) -> str:
         """Build context for Claude review.
@@ -236,20 +228,9 @@ class KustomizePlugin(Plugin):
         Returns:
             Context string for the review prompt.
         """
-        lines = [
-            "## Kustomize Diff Context",
-            "",
-            "The following kustomize directories were rendered and compared:",
-        ]
-
-        for dir_path in dirs:
-            lines.append(f"  - {dir_path}")
-
-        lines.append("")
-        lines.append("### Diff Output")
-        lines.append("")
-        lines.append("```diff")
-        lines.append(diff)
-        lines.append("```")
-
-        return "\n".join(lines)
+        dir_list = "".join(f"\n  - {dir_path}" for dir_path in dirs)
+        return (
+            "## Kustomize Diff Context\n\n"
+            f"The following kustomize directories were rendered and compared:{dir_list}\n\n"
+            f"### Diff Output\n\n```diff\n{diff}\n```"
+        )
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import re
+import stat
 import sys
 import logging
 import time
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +23,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Body of the review left when the action approves a pull request
+APPROVAL_REVIEW_BODY = "Automated approval based on structured review."
+
+# GitHub rejects issue comments longer than this
+COMMENT_MAX_LENGTH = 65536
+
+# Appended to cut comments; counts toward COMMENT_MAX_LENGTH
+TRUNCATION_SUFFIX = "\n\n... (truncated due to length)"
+
+# Top-level review fields load_review_data insists on, in error-message order
+_REVIEW_REQUIRED_FIELDS = ("approved", "overallRisk", "summary")
+_REVIEW_REQUIRED_FIELD_SET = frozenset(_REVIEW_REQUIRED_FIELDS)
+
+# Largest page GitHub serves; label and comment scans page through fewer requests
+_GITHUB_PER_PAGE = 100
+
 def find_file_in_workspace(filename: str, workspace_hint: str = "..") -> Path:
     """Search for a file in the workspace if the provided path doesn't exist."""
     logger.info(f"Searching for file: {filename} in workspace hint: {workspace_hint}")
@@ -78,7 +96,9 @@ from github.GithubException import GithubException
 from github.PullRequest import PullRequest
 from github.Repository import Repository
 from jinja2 import Environment, FileSystemLoader, Template
-from jsonschema import Draft7Validator
+
+if TYPE_CHECKING:
+    from jsonschema import Draft7Validator
 
 # Local imports - handle both module and script execution
 # When run as a script, __package__ is None, so we need to add the parent directory to sys.path
@@ -111,30 +131,33 @@ def load_review_data(review_path: Path, validate_structure: bool = True) -> dict
     """Load and validate review data from JSON file."""
     logger.info(f"Loading review data from: {review_path}")
 
-    if not review_path.exists():
+    # One stat covers the existence, file-type and size checks
+    try:
+        st = review_path.stat()
+    except FileNotFoundError:
         logger.error(f"Review file not found: {review_path}")
-        raise FileNotFoundError(f"expected review JSON at {review_path}")
+        raise FileNotFoundError(f"expected review JSON at {review_path}") from None
+    except OSError as e:
+        logger.error(f"Cannot access review file {review_path}: {e}")
+        raise ValueError(f"cannot access review file {review_path}: {e}") from e
 
-    if not review_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         logger.error(f"Path is not a file: {review_path}")
         raise ValueError(f"expected {review_path} to be a file")
 
     # Check file size to avoid empty or extremely large files
-    try:
-        file_size = review_path.stat().st_size
-        if file_size == 0:
-            logger.error(f"Review file is empty: {review_path}")
-            raise ValueError(f"review file is empty: {review_path}")
-        if file_size > 10 * 1024 * 1024:  # 10MB limit
-            logger.error(f"Review file too large ({file_size} bytes): {review_path}")
-            raise ValueError(f"review file too large ({file_size} bytes): {review_path}")
-    except OSError as e:
-        logger.error(f"Cannot access review file {review_path}: {e}")
-        raise ValueError(f"cannot access review file {review_path}: {e}") from e
+    file_size = st.st_size
+    if file_size == 0:
+        logger.error(f"Review file is empty: {review_path}")
+        raise ValueError(f"review file is empty: {review_path}")
+    if file_size > 10 * 1024 * 1024:  # 10MB limit
+        logger.error(f"Review file too large ({file_size} bytes): {review_path}")
+        raise ValueError(f"review file too large ({file_size} bytes): {review_path}")
 
     try:
-        content = review_path.read_text(encoding='utf-8')
-        if not content.strip():
+        # json.loads decodes UTF-8 bytes itself, so skip the separate str copy
+        content = review_path.read_bytes()
+        if content.isspace():
             logger.error(f"Review file contains only whitespace: {review_path}")
             raise ValueError(f"review file is empty or contains only whitespace: {review_path}")
 
@@ -146,9 +169,9 @@ def load_review_data(review_path: Path, validate_structure: bool = True) -> dict
             raise ValueError(f"review data must be a JSON object, got {type(data)}")
 
         if validate_structure:
-            required_fields = ["approved", "overallRisk", "summary"]
-            missing_fields = [field for field in required_fields if field not in data]
-            if missing_fields:
+            # Subset test on the common path; the ordered missing list only on failure
+            if not data.keys() >= _REVIEW_REQUIRED_FIELD_SET:
+                missing_fields = [field for field in _REVIEW_REQUIRED_FIELDS if field not in data]
                 logger.error(f"Review data missing required fields: {missing_fields}")
                 raise ValueError(f"review data missing required fields: {missing_fields}")
             if "findings" not in data and "changes" not in data:
@@ -164,7 +187,10 @@ def load_review_data(review_path: Path, validate_structure: bool = True) -> dict
             for item in findings_data:
                 if not isinstance(item, dict):
                     continue
-                item_type = (item.get("type") or "").lower()
+                item_type = item.get("type") or ""
+                if item_type not in {"finding", "version", "resource"}:
+                    # The schema spells types in lowercase; only stray spellings need folding
+                    item_type = item_type.lower()
                 if item_type == "version" or "component" in item:
                     version_count += 1
                 elif item_type == "resource":
@@ -192,27 +218,40 @@ def load_review_data(review_path: Path, validate_structure: bool = True) -> dict
         raise ValueError(f"cannot read review file {review_path}: {e}") from e
 
 
+@functools.lru_cache(maxsize=4)
+def _schema_validator(path: str, mtime_ns: int, size: int) -> Draft7Validator:
+    """Load a schema and build its validator; mtime and size only serve as cache keys."""
+    # jsonschema accounts for a fifth of this module's import time; only validation needs it
+    from jsonschema import Draft7Validator
+
+    # As in load_review_data, json.loads decodes the UTF-8 bytes itself
+    schema_bytes = Path(path).read_bytes()
+    if not schema_bytes or schema_bytes.isspace():
+        logger.error(f"Schema file is empty: {path}")
+        raise ValueError(f"schema file is empty: {path}")
+
+    schema = json.loads(schema_bytes)
+    logger.debug("Successfully loaded schema")
+    return Draft7Validator(schema)
+
+
 def validate_review(data: dict[str, Any], schema_path: Path) -> list[str]:
     """Validate review data against JSON schema."""
     logger.info(f"Validating review data against schema: {schema_path}")
 
-    if not schema_path.exists():
+    # One stat answers existence, type and the validator cache key
+    try:
+        schema_stat = schema_path.stat()
+    except FileNotFoundError:
         logger.error(f"Schema file not found: {schema_path}")
         raise FileNotFoundError(f"schema file not found: {schema_path}")
 
-    if not schema_path.is_file():
+    if not stat.S_ISREG(schema_stat.st_mode):
         logger.error(f"Schema path is not a file: {schema_path}")
         raise ValueError(f"expected {schema_path} to be a file")
 
     try:
-        schema_text = schema_path.read_text(encoding='utf-8')
-        if not schema_text.strip():
-            logger.error(f"Schema file is empty: {schema_path}")
-            raise ValueError(f"schema file is empty: {schema_path}")
-
-        schema = json.loads(schema_text)
-        logger.debug("Successfully loaded schema")
-
+        validator = _schema_validator(str(schema_path), schema_stat.st_mtime_ns, schema_stat.st_size)
     except json.JSONDecodeError as exc:
         logger.error(f"Invalid JSON in schema file {schema_path}: {exc}")
         raise ValueError(f"unable to parse schema JSON from {schema_path}: {exc}") from exc
@@ -224,7 +263,6 @@ def validate_review(data: dict[str, Any], schema_path: Path) -> list[str]:
         raise ValueError(f"cannot read schema file {schema_path}: {e}") from e
 
     try:
-        validator = Draft7Validator(schema)
         errors = list(validator.iter_errors(data))
         errors.sort(key=lambda err: list(err.path))
 
@@ -331,7 +369,7 @@ def build_markdown(
         findings_data = _get_findings(data)
 
         normalized_findings = []
-        finding_anchor_counter: defaultdict[str, int] = defaultdict(int)
+        finding_anchor_counter: dict[str, int] = {}
 
         for i, item in enumerate(findings_data):
             if not isinstance(item, dict):
@@ -550,11 +588,13 @@ def _parse_pr_number(value: object) -> int | None:
     return None
 
 
-def _should_skip_merge() -> bool:
-    override = (os.environ.get("REVIEW_SKIP_MERGE") or "").strip().lower()
+def _should_skip_merge(env: Optional[Mapping[str, str]] = None) -> bool:
+    if env is None:
+        env = os.environ
+    override = (env.get("REVIEW_SKIP_MERGE") or "").strip().lower()
     if override in {"1", "true", "yes"}:
         return True
-    return os.environ.get("GITHUB_EVENT_NAME") == "workflow_dispatch"
+    return env.get("GITHUB_EVENT_NAME") == "workflow_dispatch"
 
 
 def should_auto_merge(pr: PullRequest, auto_merge_config: dict[str, Any]) -> tuple[bool, str]:
@@ -642,7 +682,7 @@ def load_pull_request(token: str, timeout: int = 30) -> PullRequest:
             raise ValueError(f"expected {event_path} to be a file")
 
         event_text = event_path_obj.read_text(encoding='utf-8')
-        if not event_text.strip():
+        if not event_text or event_text.isspace():
             logger.error("Event file is empty")
             raise ValueError("event file is empty")
 
@@ -693,7 +733,7 @@ def load_pull_request(token: str, timeout: int = 30) -> PullRequest:
         logger.debug("Initializing GitHub client")
         # Note: Using deprecated login_or_token parameter as in original code
         # Consider updating to auth=github.Auth.Token(...) in future
-        gh = Github(token, timeout=timeout)
+        gh = Github(token, timeout=timeout, per_page=_GITHUB_PER_PAGE)
         logger.debug("GitHub client initialized successfully")
     except Exception as exc:
         logger.error(f"Failed to initialize GitHub client: {exc}")
@@ -878,12 +918,44 @@ def apply_labels(pr: PullRequest, labels: dict[str, str]) -> None:
             raise ValueError(f"unexpected error adding labels to pull request: {exc}") from exc
 
 
-def publish_comment(pr: PullRequest, markdown: str) -> None:
+def truncate_comment(markdown: str) -> str:
+    """Truncate markdown to GitHub's comment size limit, suffix included."""
+    if len(markdown) > COMMENT_MAX_LENGTH:
+        logger.warning(f"Comment too long ({len(markdown)} chars), truncating to {COMMENT_MAX_LENGTH}")
+        markdown = markdown[:COMMENT_MAX_LENGTH - len(TRUNCATION_SUFFIX)] + TRUNCATION_SUFFIX
+    return markdown
+
+
+def has_bot_comment(pr: PullRequest) -> bool:
+    """Check whether a bot has already commented on the pull request.
+
+    Lookup failures are logged and treated as no existing comment.
+    """
+    try:
+        comments = pr.get_issue_comments()
+        for comment in comments:
+            if comment.user.type == "Bot":
+                logger.info(f"Bot comment already exists (ID: {comment.id}), skipping post to ensure only one comment per review cycle")
+                return True
+        logger.info("No existing bot comments found, proceeding to post comment")
+    except Exception as exc:
+        logger.warning(f"Could not check for existing comments: {exc}")
+        # Continue to attempt posting
+    return False
+
+
+def publish_comment(pr: PullRequest, markdown: str, already_commented: Optional[bool] = None) -> None:
     """Publish comment to pull request with error handling and retry logic.
 
     Only posts a comment if no bot comment already exists on the PR.
     This ensures exactly one comment per review cycle, even if multiple
     workflows run concurrently.
+
+    Args:
+        pr: Pull request to comment on.
+        markdown: Comment body.
+        already_commented: Result of an earlier has_bot_comment check this run,
+            or None to look it up here.
     """
     if not markdown or not markdown.strip():
         logger.warning("Empty markdown content, skipping comment publication")
@@ -892,21 +964,13 @@ def publish_comment(pr: PullRequest, markdown: str) -> None:
     logger.info("Publishing review comment to pull request")
 
     # Validate markdown content
-    if len(markdown) > 65536:  # GitHub comment limit
-        logger.warning(f"Comment too long ({len(markdown)} chars), truncating to 65536")
-        markdown = markdown[:65536] + "\n\n... (truncated due to length)"
+    markdown = truncate_comment(markdown)
 
     # Check if any bot comment already exists - if so, skip posting
-    try:
-        comments = pr.get_issue_comments()
-        for comment in comments:
-            if comment.user.type == "Bot":
-                logger.info(f"Bot comment already exists (ID: {comment.id}), skipping post to ensure only one comment per review cycle")
-                return
-        logger.info("No existing bot comments found, proceeding to post comment")
-    except Exception as exc:
-        logger.warning(f"Could not check for existing comments: {exc}")
-        # Continue to attempt posting
+    if already_commented is None:
+        already_commented = has_bot_comment(pr)
+    if already_commented:
+        return
 
     max_retries = 3
     for attempt in range(max_retries):
@@ -949,7 +1013,7 @@ def approve_and_merge(pr: PullRequest) -> None:
         try:
             logger.debug(f"Creating approval review (attempt {attempt + 1}/{max_retries})")
             pr.create_review(
-                body="Automated approval based on structured review.",
+                body=APPROVAL_REVIEW_BODY,
                 event="APPROVE"
             )
             logger.info("Successfully created approval review")
@@ -964,9 +1028,15 @@ def approve_and_merge(pr: PullRequest) -> None:
             logger.error(f"Unexpected error creating review: {exc}")
             raise ValueError(f"unexpected error creating approval review: {exc}") from exc
 
+    merge_pull_request(pr)
+
+
+def merge_pull_request(pr: PullRequest) -> None:
+    """Merge an already approved pull request and delete its branch."""
     logger.info("Merging pull request")
 
     # Merge PR with retry logic
+    max_retries = 3
     merge_result = None
     for attempt in range(max_retries):
         try:
@@ -986,45 +1056,55 @@ def approve_and_merge(pr: PullRequest) -> None:
 
     # Attempt to delete the branch if the PR originates from the same repository.
     if merge_result:
-        try:
-            logger.debug("Checking if branch can be deleted")
-            head_repo = pr.head.repo
-            base_repo = pr.base.repo
-
-            if (
-                head_repo is not None
-                and base_repo is not None
-                and head_repo.full_name == base_repo.full_name
-            ):
-                ref = pr.head.ref
-                logger.info(f"Deleting branch: {ref}")
-
-                # Delete branch with retry logic
-                for attempt in range(max_retries):
-                    try:
-                        logger.debug(f"Deleting branch ref (attempt {attempt + 1}/{max_retries})")
-                        base_repo.get_git_ref(f"heads/{ref}").delete()
-                        logger.info(f"Successfully deleted branch: {ref}")
-                        break
-                    except GithubException as exc:
-                        logger.warning(f"GitHub API error deleting branch (attempt {attempt + 1}): {exc}")
-                        if attempt == max_retries - 1:
-                            logger.warning(f"Failed to delete branch after {max_retries} attempts: {exc}")
-                            # Don't fail the entire operation for branch deletion failure
-                            break
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                    except Exception as exc:
-                        logger.warning(f"Unexpected error deleting branch: {exc}")
+        delete_merged_branch(pr)
+    else:
+        logger.warning("No merge result available, skipping branch deletion")
+
+
+def delete_merged_branch(pr: PullRequest) -> None:
+    """Delete the head branch of a merged pull request, best effort.
+
+    Only branches in the same repository as the base are deleted; failures are
+    logged and never raised.
+    """
+    max_retries = 3
+    try:
+        logger.debug("Checking if branch can be deleted")
+        head_repo = pr.head.repo
+        base_repo = pr.base.repo
+
+        if (
+            head_repo is not None
+            and base_repo is not None
+            and head_repo.full_name == base_repo.full_name
+        ):
+            ref = pr.head.ref
+            logger.info(f"Deleting branch: {ref}")
+
+            # Delete branch with retry logic
+            for attempt in range(max_retries):
+                try:
+                    logger.debug(f"Deleting branch ref (attempt {attempt + 1}/{max_retries})")
+                    base_repo.get_git_ref(f"heads/{ref}").delete()
+                    logger.info(f"Successfully deleted branch: {ref}")
+                    break
+                except GithubException as exc:
+                    logger.warning(f"GitHub API error deleting branch (attempt {attempt + 1}): {exc}")
+                    if attempt == max_retries - 1:
+                        logger.warning(f"Failed to delete branch after {max_retries} attempts: {exc}")
                         # Don't fail the entire operation for branch deletion failure
                         break
-            else:
-                logger.debug("PR originates from different repository, not deleting branch")
+                    time.sleep(2 ** attempt)  # Exponential backoff
+                except Exception as exc:
+                    logger.warning(f"Unexpected error deleting branch: {exc}")
+                    # Don't fail the entire operation for branch deletion failure
+                    break
+        else:
+            logger.debug("PR originates from different repository, not deleting branch")
 
-        except Exception as exc:
-            # Best-effort cleanup - don't fail the entire operation
-            logger.warning(f"Failed to delete branch during cleanup (non-critical): {exc}")
-    else:
-        logger.warning("No merge result available, skipping branch deletion")
+    except Exception as exc:
+        # Best-effort cleanup - don't fail the entire operation
+        logger.warning(f"Failed to delete branch during cleanup (non-critical): {exc}")
 
 
 def main(argv: Optional[list[str]] = None) -> None:
@@ -7,17 +7,341 @@ Supported skill sources:
 4. Raw URLs to SKILL.md files
 """
 
+import functools
+import hashlib
 import logging
 import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
-from ..github_utils import fetch_file_from_github
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..github_utils import (
+    fetch_file_from_github,
+    fetch_file_from_github_conditional,
+    fetch_files_from_github,
+)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads fetching skill sources at once
+_MAX_SKILL_WORKERS = 8
+
+# owner/repo[:ref]:skill-path; a ref is a slash-free segment followed by another colon
+_GITHUB_SPEC_RE = re.compile(r"(?=[^/.]*/)(?P<repo>[^:]*):(?:(?P<ref>[^:/]*):)?(?P<path>.*)", re.DOTALL)
+
+# Source types loaded over the network; only these are worth a worker thread
+_REMOTE_SOURCE_TYPES = frozenset({"github", "url"})
+
+# Seconds a fetched GitHub skill (or a miss) is reused before fetching it again
+_GITHUB_SKILL_TTL = 300.0
+
+# Process-wide GitHub skill cache: (repository, ref, path, token) -> (fetched at, content)
+_github_skill_cache: dict[tuple[str, str, str, str], tuple[float, Optional[str]]] = {}
+_github_skill_cache_lock = threading.Lock()
+
+# Seconds to wait for a URL skill before giving up on it
+_URL_SKILL_TIMEOUT = 10
+
+# Oldest disk-cached skill still served when a refetch fails (stale-while-revalidate)
+_SKILL_DISK_MAX_STALE = 7 * 24 * 3600.0
+
+
+@functools.lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """Get the shared session for URL skills, so fetches reuse keep-alive connections.
+
+    Returns:
+        Session pooling up to _MAX_SKILL_WORKERS connections per host.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_MAX_SKILL_WORKERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=32)
+def _read_local_skill(path: str, mtime_ns: int, size: int) -> str:
+    """Read a local skill file; mtime and size only serve as cache keys, so an edit rereads it."""
+    return Path(path).read_text()
+
+
+def _fresh_cached_skill(key: tuple[str, str, str, str]) -> Optional[tuple[float, Optional[str]]]:
+    """Get the cache entry for a GitHub skill if it is still within the TTL.
+
+    Args:
+        key: (repository, ref, path, token).
+
+    Returns:
+        (fetched at, content) entry, or None if absent or stale.
+    """
+    with _github_skill_cache_lock:
+        cached = _github_skill_cache.get(key)
+    if cached and time.monotonic() - cached[0] < _GITHUB_SKILL_TTL:
+        return cached
+    return None
+
+
+def _cache_skill(key: tuple[str, str, str, str], content: Optional[str]) -> None:
+    """Store a fetched GitHub skill (or a miss) in the cache.
+
+    Args:
+        key: (repository, ref, path, token).
+        content: File content, or None if not found.
+    """
+    with _github_skill_cache_lock:
+        _github_skill_cache[key] = (time.monotonic(), content)
+
+
+def _disk_skill_file(cache_dir: Path, repository: str, ref: str, path: str, token: str) -> Path:
+    """Get the disk cache file for a GitHub skill.
+
+    The token is part of the key, so a skill fetched with access to a private
+    repository is never served to a run whose token lacks that access.
+
+    Args:
+        cache_dir: Skill cache directory.
+        repository: Repository name (e.g., "owner/repo").
+        ref: Git ref (branch, tag, or commit).
+        path: Path to the file in the repository.
+        token: GitHub token the skill is fetched with.
+
+    Returns:
+        Path of the cache file (which may not exist).
+    """
+    digest = hashlib.sha1(f"{repository}\0{ref}\0{path}\0{token}".encode()).hexdigest()
+    return cache_dir / f"{digest}.md"
+
+
+def _read_disk_skill(cache_file: Path) -> Optional[tuple[float, str]]:
+    """Read a disk-cached skill unless it is too old to serve even as a fallback.
+
+    Args:
+        cache_file: File from _disk_skill_file.
+
+    Returns:
+        (age in seconds, content), or None if absent or unusable.
+    """
+    try:
+        age = time.time() - cache_file.stat().st_mtime
+        if age > _SKILL_DISK_MAX_STALE:
+            return None
+        return age, cache_file.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _read_disk_etag(cache_file: Path) -> Optional[str]:
+    """Read the ETag stored next to a disk-cached skill.
+
+    Args:
+        cache_file: File from _disk_skill_file.
+
+    Returns:
+        ETag of the cached content, or None if there is none.
+    """
+    try:
+        return cache_file.with_suffix(".etag").read_text(encoding="utf-8") or None
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _replace_file(path: Path, text: str) -> None:
+    """Write text to a unique temp file beside path, then rename it into place.
+
+    Concurrent writers (other runs, or other threads of this one) each get their
+    own temp file, so a reader only ever sees one writer's complete file.
+
+    Args:
+        path: Destination file.
+        text: Text to write.
+    """
+    fd, partial = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(partial, path)
+    except BaseException:
+        os.unlink(partial)
+        raise
+
+
+def _write_disk_skill(cache_file: Path, content: str, etag: Optional[str] = None) -> None:
+    """Store a fetched skill (and its ETag, if known) on disk; failures only cost the cache.
+
+    Args:
+        cache_file: File from _disk_skill_file.
+        content: Skill content.
+        etag: ETag GitHub returned with the content.
+    """
+    etag_file = cache_file.with_suffix(".etag")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Drop the old ETag first so it is never paired with the new content
+        etag_file.unlink(missing_ok=True)
+        _replace_file(cache_file, content)
+        if etag:
+            _replace_file(etag_file, etag)
+    except OSError as e:
+        logger.debug(f"Could not write skill cache {cache_file}: {e}")
+
+
+def _fetch_into_disk_cache(
+    cache_file: Path,
+    on_disk: Optional[tuple[float, str]],
+    repository: str,
+    path: str,
+    token: str,
+    ref: str,
+) -> Optional[str]:
+    """Fetch a skill into the disk cache, revalidating a stale copy by its ETag.
+
+    Args:
+        cache_file: File from _disk_skill_file.
+        on_disk: Stale (age, content) already on disk, if any.
+        repository: Repository name (e.g., "owner/repo").
+        path: Path to the file in the repository.
+        token: GitHub token for authentication.
+        ref: Git ref (branch, tag, or commit).
+
+    Returns:
+        Current file content; the stale copy if refetching failed; None if the
+        file is gone (its cached copy is dropped) or there is nothing to serve.
+    """
+    etag = _read_disk_etag(cache_file) if on_disk else None
+    status, etag, content = fetch_file_from_github_conditional(repository, path, token, ref, etag)
+    if status == 304 and on_disk:
+        logger.debug(f"Skill {repository}:{ref}:{path} not modified")
+        try:
+            # Restart the TTL without rewriting the content
+            os.utime(cache_file)
+        except OSError:
+            pass
+        return on_disk[1]
+    if content is not None:
+        _write_disk_skill(cache_file, content, etag)
+        return content
+    if status == 404:
+        # Deleted upstream (or no longer readable with this token), not a failed fetch
+        if on_disk:
+            logger.info(f"Skill {repository}:{ref}:{path} no longer exists, dropping cached copy")
+            try:
+                cache_file.unlink(missing_ok=True)
+                cache_file.with_suffix(".etag").unlink(missing_ok=True)
+            except OSError:
+                pass
+        return None
+    if on_disk:
+        logger.warning(
+            f"Could not fetch skill {repository}:{ref}:{path}, "
+            f"using cached copy from {on_disk[0]:.0f}s ago"
+        )
+        return on_disk[1]
+    return None
+
+
+def _cached_fetch(
+    repository: str,
+    path: str,
+    token: str,
+    ref: str,
+    cache_dir: Optional[Path] = None,
+) -> Optional[str]:
+    """Fetch a file from GitHub, reusing a recent result for the same file.
+
+    Misses are cached too, so a missing skill is not looked up again on every load.
+    With a cache_dir, fetched skills also persist across processes: a fresh disk
+    copy is used as is, a stale one is revalidated with its ETag (a 304 answer is
+    free against the rate limit), and it is still served if refetching it fails.
+    A 404 is not a failure: the file was deleted, and its stale copy is dropped.
+
+    Args:
+        repository: Repository name (e.g., "owner/repo").
+        path: Path to the file in the repository.
+        token: GitHub token for authentication.
+        ref: Git ref (branch, tag, or commit).
+        cache_dir: Optional directory for the persistent skill cache.
+
+    Returns:
+        File content as string, or None if not found.
+    """
+    key = (repository, ref, path, token)
+    cached = _fresh_cached_skill(key)
+    if cached:
+        logger.debug(f"Using cached skill {repository}:{ref}:{path}")
+        return cached[1]
+
+    on_disk = None
+    if cache_dir is not None:
+        cache_file = _disk_skill_file(cache_dir, repository, ref, path, token)
+        on_disk = _read_disk_skill(cache_file)
+        if on_disk and on_disk[0] < _GITHUB_SKILL_TTL:
+            logger.debug(f"Using disk-cached skill {repository}:{ref}:{path}")
+            _cache_skill(key, on_disk[1])
+            return on_disk[1]
+
+    if cache_dir is None:
+        content = fetch_file_from_github(repository=repository, path=path, token=token, ref=ref)
+    else:
+        content = _fetch_into_disk_cache(cache_file, on_disk, repository, path, token, ref)
+    _cache_skill(key, content)
+    return content
+
+
+def _prefetch_github_skills(
+    files: list[tuple[str, str, str]],
+    token: str,
+    cache_dir: Optional[Path] = None,
+) -> None:
+    """Warm the skill cache with one GraphQL query per repository.
+
+    Files with a fresh cached copy, or a stale one that can be revalidated by
+    its ETag, are skipped. Repositories with a single file
+    left, and any whose query fails, are left to the per-file fetch in _cached_fetch.
+
+    Args:
+        files: (repository, ref, path) of each GitHub skill about to be loaded.
+        token: GitHub token for authentication.
+        cache_dir: Optional directory for the persistent skill cache.
+    """
+    by_repo: dict[str, list[tuple[str, str]]] = {}
+    for repository, ref, path in files:
+        if _fresh_cached_skill((repository, ref, path, token)):
+            continue
+        if cache_dir is not None:
+            cache_file = _disk_skill_file(cache_dir, repository, ref, path, token)
+            on_disk = _read_disk_skill(cache_file)
+            if on_disk and on_disk[0] < _GITHUB_SKILL_TTL:
+                continue
+            if on_disk and _read_disk_etag(cache_file):
+                # Revalidating by ETag is cheaper than refetching through GraphQL
+                continue
+        by_repo.setdefault(repository, []).append((ref, path))
+
+    for repository, repo_files in by_repo.items():
+        if len(repo_files) < 2:
+            continue
+        contents = fetch_files_from_github(repository, repo_files, token)
+        if contents is None:
+            continue
+        logger.info(f"Fetched {len(repo_files)} skills from {repository} in one request")
+        for (ref, path), content in zip(repo_files, contents):
+            if content is None:
+                # Leave misses to _cached_fetch, which tells a deleted file from a failed fetch
+                continue
+            if cache_dir is not None:
+                _write_disk_skill(_disk_skill_file(cache_dir, repository, ref, path, token), content)
+            _cache_skill((repository, ref, path, token), content)
+
 
 # Default built-in skills
 DEFAULT_PR_REVIEW_SKILL = """# Pull Request Review Toolkit
@@ -138,12 +462,16 @@ class SkillLoader:
         SkillSource("builtin", "pr-review-toolkit", "PR Review Toolkit"),
     ]
 
+    # Combined text of DEFAULT_SKILLS; they are all built in, so it is built once
+    _default_skills_text: Optional[str] = None
+
     def __init__(
         self,
         workspace_root: Path,
         repository: str,
         github_token: str,
         default_branch: str = "main",
+        cache_dir: Optional[Path] = None,
     ):
         """Initialize the skill loader.
 
@@ -152,11 +480,15 @@ class SkillLoader:
             repository: GitHub repository name (e.g., "owner/repo").
             github_token: GitHub token for API access.
             default_branch: Default branch name (default: "main").
+            cache_dir: Optional directory persisting GitHub skills across runs.
         """
         self.workspace_root = workspace_root
         self.repository = repository
         self.github_token = github_token
         self.default_branch = default_branch
+        self.cache_dir = cache_dir
+        # Local skills live under one directory; join it once instead of per lookup
+        self._local_skills_dir = workspace_root / ".claude" / "skills"
 
     def load_skills(
         self,
@@ -180,27 +512,77 @@ class SkillLoader:
         if skill_specs is None:
             skill_specs = []
 
-        sources = []
-
         # Include default skills if requested and no explicit skills provided
         if include_defaults and not skill_specs:
-            sources = list(self.DEFAULT_SKILLS)
+            if self._default_skills_text is None:
+                type(self)._default_skills_text = self._combine_skills(list(self.DEFAULT_SKILLS))
+            return self._default_skills_text
+
+        sources = []
+        seen: set[tuple[str, object]] = set()
 
-        # Parse and add user-specified skills
+        # Parse and add user-specified skills, once each however they were spelled
         for spec in skill_specs:
             source = self._parse_skill_spec(spec)
-            if source:
+            if not source:
+                logger.warning(f"Could not parse skill spec: {spec}")
+                continue
+            # GitHub specs naming the same file can differ in ref and SKILL.md spelling
+            identity: tuple[str, object] = (source.type, source.source)
+            if source.type == "github":
+                identity = (source.type, self._github_skill_file(source.source) or source.source)
+            if identity in seen:
+                logger.debug(f"Skipping duplicate skill source: {source}")
+            else:
+                seen.add(identity)
                 sources.append(source)
                 logger.info(f"Added skill source: {source}")
-            else:
-                logger.warning(f"Could not parse skill spec: {spec}")
 
-        # Load content from all sources
-        skill_parts = []
-        for source in sources:
-            content = self._load_from_source(source)
+        return self._combine_skills(sources)
+
+    def _combine_skills(self, sources: list[SkillSource]) -> str:
+        """Load skill sources and join them into one document.
+
+        Args:
+            sources: Sources to load, in output order.
+
+        Returns:
+            Combined skill content, or the default skill if none could be loaded.
+        """
+        # Batch GitHub skills that share a repository into one request
+        github_files = [
+            file
+            for source in sources
+            if source.type == "github" and (file := self._github_skill_file(source.source))
+        ]
+        if len(github_files) > 1:
+            _prefetch_github_skills(github_files, self.github_token, self.cache_dir)
+
+        # Load content from all sources. Remote fetches are independent, so they run
+        # concurrently; local and built-in skills load inline while those are in flight.
+        remote_count = sum(source.type in _REMOTE_SOURCE_TYPES for source in sources)
+        if remote_count > 1:
+            with ThreadPoolExecutor(max_workers=min(remote_count, _MAX_SKILL_WORKERS)) as executor:
+                fetches = {
+                    index: executor.submit(self._load_from_source, source)
+                    for index, source in enumerate(sources)
+                    if source.type in _REMOTE_SOURCE_TYPES
+                }
+                contents = [
+                    fetches[index].result() if index in fetches else self._load_from_source(source)
+                    for index, source in enumerate(sources)
+                ]
+        else:
+            contents = [self._load_from_source(source) for source in sources]
+
+        # Headers, separators and contents go into one join, so each skill's
+        # content is copied once rather than into a per-skill string first
+        skill_parts: list[str] = []
+        for source, content in zip(sources, contents):
             if content:
-                skill_parts.append(f"## {source.name}\n\n{content}")
+                if skill_parts:
+                    skill_parts.append("\n\n---\n\n")
+                skill_parts += (f"## {source.name}\n\n", content)
             else:
                 logger.warning(f"Failed to load skill: {source}")
 
@@ -208,7 +590,7 @@ class SkillLoader:
             logger.warning("No skills loaded, using default")
             return DEFAULT_PR_REVIEW_SKILL
 
-        return "\n\n---\n\n".join(skill_parts)
+        return "".join(skill_parts)
 
     def load_skill(self, skill_name: Optional[str] = None) -> str:
         """Load a single skill (backward compatibility).
@@ -223,6 +605,12 @@ class SkillLoader:
             return self.load_skills([skill_name])
         return self.load_skills([])
 
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop all cached GitHub skill fetches."""
+        with _github_skill_cache_lock:
+            _github_skill_cache.clear()
+
     def _parse_skill_spec(self, spec: str) -> Optional[SkillSource]:
         """Parse a skill specification string.
 
@@ -262,46 +650,21 @@ class SkillLoader:
         if self._is_url(spec):
             return SkillSource("url", spec, f"URL: {spec}")
 
-        # GitHub repo format: owner/repo[:ref]:skill-path
-        # Must start with owner/repo (one slash, owner has no dots in ref part)
-        if "/" in spec:
-            parts = spec.split("/")
-            if len(parts) >= 2 and "." not in parts[0]:
-                # This looks like owner/repo...
-                # Now parse the rest which may contain colons
-                rest = "/".join(parts[2:]) if len(parts) > 2 else ""
-                repo_part = f"{parts[0]}/{parts[1]}"
-
-                # Check if there's a :ref or :path after repo
-                if ":" in spec:
-                    # Split on first colon after repo
-                    repo_part_with_rest = spec.split("/", 2)[2] if len(parts) > 2 else ""
-                    colon_parts = spec.split(":")
-                    # owner/repo is colon_parts[0] if split on : doesn't affect /
-                    # Actually, let's use a different approach
-                    pass
-
-                # Simpler: Use split(":") on the whole spec
-                colon_parts = spec.split(":")
-                if len(colon_parts) >= 2:
-                    # First part is owner/repo
-                    repo_part = colon_parts[0]
-                    # Check if second part looks like a ref (no slashes, short)
-                    if len(colon_parts) >= 3 and "/" not in colon_parts[1]:
-                        ref = colon_parts[1]
-                        skill_path = ":".join(colon_parts[2:])
-                    else:
-                        # Second part is part of the path
-                        ref = self.default_branch
-                        skill_path = ":".join(colon_parts[1:])
-                    return SkillSource(
-                        "github",
-                        f"{repo_part}:{ref}:{skill_path}",
-                        f"{repo_part}:{skill_path}",
-                    )
+        # GitHub repo format: owner/repo[:ref]:skill-path (owner has no dots);
+        # plain skill names have no slash and skip the regex entirely
+        match = _GITHUB_SPEC_RE.fullmatch(spec) if "/" in spec else None
+        if match:
+            repo_part = match["repo"]
+            ref = match["ref"] if match["ref"] is not None else self.default_branch
+            skill_path = match["path"]
+            return SkillSource(
+                "github",
+                f"{repo_part}:{ref}:{skill_path}",
+                f"{repo_part}:{skill_path}",
+            )
 
         # Check if it's a local skill
-        local_path = self.workspace_root / ".claude" / "skills" / spec / "SKILL.md"
+        local_path = self._local_skills_dir / spec / "SKILL.md"
         if local_path.exists():
             return SkillSource("local", spec, f"Local: {spec}")
 
@@ -314,6 +677,9 @@ class SkillLoader:
 
     def _is_url(self, s: str) -> bool:
         """Check if string is a URL."""
+        # Skill names and repo specs fail this prefix test; only candidates get parsed
+        if not s[:8].lower().startswith(("http://", "https://")):
+            return False
         try:
             result = urlparse(s)
             return result.scheme in ("http", "https") and result.netloc
@@ -348,30 +714,31 @@ class SkillLoader:
         Returns:
             Skill content or None if not found.
         """
-        skill_path = self.workspace_root / ".claude" / "skills" / skill_name / "SKILL.md"
+        skill_path = self._local_skills_dir / skill_name / "SKILL.md"
 
-        if not skill_path.exists():
+        # Stat directly rather than probing with exists() first
+        try:
+            stat = skill_path.stat()
+            return _read_local_skill(str(skill_path), stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
             logger.debug(f"Local skill not found: {skill_path}")
             return None
-
-        try:
-            return skill_path.read_text()
         except Exception as e:
             logger.warning(f"Failed to read local skill {skill_name}: {e}")
             return None
 
-    def _load_github(self, spec: str) -> Optional[str]:
-        """Load a skill from a GitHub repository.
+    @staticmethod
+    def _github_skill_file(spec: str) -> Optional[tuple[str, str, str]]:
+        """Split a GitHub skill spec into the file to fetch.
 
         Args:
             spec: Format "owner/repo:ref:skill-path"
 
         Returns:
-            Skill content or None if not found.
+            (repository, ref, path to SKILL.md), or None if the spec is invalid.
         """
         parts = spec.split(":")
         if len(parts) < 3:
-            logger.warning(f"Invalid GitHub skill spec: {spec}")
             return None
 
         repo = parts[0]
@@ -383,14 +750,25 @@ class SkillLoader:
         if not skill_path.endswith("SKILL.md"):
             skill_path = f"{skill_path}/SKILL.md"
 
+        return repo, ref, skill_path
+
+    def _load_github(self, spec: str) -> Optional[str]:
+        """Load a skill from a GitHub repository.
+
+        Args:
+            spec: Format "owner/repo:ref:skill-path"
+
+        Returns:
+            Skill content or None if not found.
+        """
+        file = self._github_skill_file(spec)
+        if file is None:
+            logger.warning(f"Invalid GitHub skill spec: {spec}")
+            return None
+        repo, ref, skill_path = file
+
         try:
-            content = fetch_file_from_github(
-                repository=repo,
-                path=skill_path,
-                token=self.github_token,
-                ref=ref,
-            )
-            return content
+            return _cached_fetch(repo, skill_path, self.github_token, ref, self.cache_dir)
         except Exception as e:
             logger.warning(f"Failed to load skill from GitHub {spec}: {e}")
             return None
@@ -405,11 +783,10 @@ class SkillLoader:
             Skill content or None if not found.
         """
         try:
-            import urllib.request
-
             logger.info(f"Fetching skill from URL: {url}")
-            with urllib.request.urlopen(url, timeout=10) as response:
-                return response.read().decode("utf-8")
+            response = _http_session().get(url, timeout=_URL_SKILL_TIMEOUT)
+            response.raise_for_status()
+            return response.content.decode("utf-8")
         except Exception as e:
             logger.warning(f"Failed to load skill from URL {url}: {e}")
             return None
@@ -422,14 +799,15 @@ class SkillLoader:
         """
         # Check for .cletus-skills config file
         config_path = self.workspace_root / ".cletus-skills"
-        if config_path.exists():
-            try:
-                content = config_path.read_text().strip()
-                if content:
-                    logger.info(f"Found .cletus-skills config: {content}")
-                    return content
-            except Exception as e:
-                logger.warning(f"Failed to read .cletus-skills: {e}")
+        try:
+            content = config_path.read_text().strip()
+            if content:
+                logger.info(f"Found .cletus-skills config: {content}")
+                return content
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to read .cletus-skills: {e}")
 
         # Auto-detect based on repo name or conventions
         if self.repository.endswith("k8s"):
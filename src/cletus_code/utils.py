@@ -1,13 +1,20 @@
 """Utility functions for process_review."""
 
 import re
-from collections import defaultdict
+import string
 from typing import Dict
 
 
+# First non-whitespace character; lets truncate measure long text without copying it
+_NON_SPACE_RE = re.compile(r"\S")
+
+
 def truncate(text: str, limit: int = 300) -> str:
     """Truncate text to a maximum length, adding "..." if truncated.
 
+    Surrounding whitespace is ignored. Long inputs are only read around the cut,
+    never copied whole.
+
     Args:
         text: The text to truncate.
         limit: Maximum length before truncation.
@@ -15,10 +22,23 @@ def truncate(text: str, limit: int = 300) -> str:
     Returns:
         Truncated text with "..." appended if shortened.
     """
-    text = (text or "").strip()
+    if not text:
+        return ""
     if len(text) <= limit:
-        return text
-    return text[: limit - 3] + "..."
+        return text.strip()
+    if limit < 3:
+        # The cut then counts back from the end of the stripped text; rare, so just strip
+        text = text.strip()
+        return text if len(text) <= limit else text[: limit - 3] + "..."
+
+    first = _NON_SPACE_RE.search(text)
+    if first is None:
+        return ""
+    start = first.start()
+    # Stripped text fits unless something other than whitespace follows the limit
+    if _NON_SPACE_RE.search(text, start + limit) is None:
+        return text[start:].rstrip()
+    return text[start : start + limit - 3] + "..."
 
 
 def normalize_risk(value: str | None) -> str:
@@ -41,6 +61,14 @@ _RISK_PRIORITY: Dict[str, int] = {
     "UNKNOWN": 3,
 }
 
+# Sort keys for the spellings seen in practice, so sorting skips the upper() per item
+_RISK_SORT_KEYS: Dict[str | None, int] = {
+    spelling: priority
+    for risk, priority in _RISK_PRIORITY.items()
+    for spelling in (risk, risk.lower(), risk.capitalize())
+}
+_RISK_SORT_KEYS[None] = _RISK_SORT_KEYS[""] = _RISK_PRIORITY["UNKNOWN"]
+
 
 def risk_sort_key(value: str | None) -> int:
     """Get sort key for risk level (HIGH sorts first).
@@ -51,13 +79,19 @@ def risk_sort_key(value: str | None) -> int:
     Returns:
         Integer sort key (lower = higher priority).
     """
-    normalized = normalize_risk(value)
-    return _RISK_PRIORITY.get(normalized, len(_RISK_PRIORITY))
+    priority = _RISK_SORT_KEYS.get(value)
+    if priority is None:
+        priority = _RISK_PRIORITY.get(normalize_risk(value), len(_RISK_PRIORITY))
+    return priority
 
 
 # Regular expression for creating URL-safe anchors
 _ANCHOR_ALLOWED_RE = re.compile(r"[^a-z0-9]+")
 
+# bytes.translate table for ASCII slugs: [a-z0-9] kept, every other byte becomes a space
+_ANCHOR_ALLOWED = frozenset(string.ascii_lowercase.encode() + string.digits.encode())
+_ANCHOR_ASCII_TABLE = bytes(byte if byte in _ANCHOR_ALLOWED else ord(" ") for byte in range(256))
+
 
 def slugify(text: str, fallback: str) -> str:
     """Convert text to a URL-safe slug.
@@ -69,16 +103,20 @@ def slugify(text: str, fallback: str) -> str:
     Returns:
         URL-safe slug string.
     """
-    normalized = (text or "").strip().lower()
-    slug = _ANCHOR_ALLOWED_RE.sub("-", normalized).strip("-")
+    normalized = (text or "").lower()
+    if normalized.isascii():
+        # One C-level pass maps separators to spaces; split() then collapses and trims them
+        slug = b"-".join(normalized.encode().translate(_ANCHOR_ASCII_TABLE).split()).decode()
+    else:
+        slug = _ANCHOR_ALLOWED_RE.sub("-", normalized).strip("-")
     return slug or fallback
 
 
-def make_anchor(counter: defaultdict, prefix: str, text: str, fallback: str) -> str:
+def make_anchor(counter: Dict[str, int], prefix: str, text: str, fallback: str) -> str:
     """Create a unique anchor ID, handling duplicates.
 
     Args:
-        counter: defaultdict(int) for tracking duplicates.
+        counter: Dict tracking how often each anchor has been handed out.
         prefix: Optional prefix for the anchor (e.g., "resource").
         text: Text to slugify for the anchor.
         fallback: Default value if text is empty.
@@ -88,11 +126,10 @@ def make_anchor(counter: defaultdict, prefix: str, text: str, fallback: str) ->
     """
     base = slugify(text, fallback)
     anchor = f"{prefix}-{base}" if prefix else base
-    if counter[anchor]:
-        suffix = counter[anchor]
-        counter[anchor] += 1
-        return f"{anchor}-{suffix}"
-    counter[anchor] += 1
+    seen = counter.get(anchor, 0)
+    counter[anchor] = seen + 1
+    if seen:
+        return f"{anchor}-{seen}"
     return anchor
 
 
@@ -20,8 +20,48 @@ def project_root():
     # Assumes tests/act_integration is 2 levels deep from root
     return Path(__file__).parent.parent.parent.resolve()
 
+@pytest.fixture(scope="session")
+def file_secrets(project_root):
+    """Parse the gitignored secrets file once per session.
+
+    Returns:
+        Dict of secrets from the first of .secrets/.env found, or None if neither exists.
+    """
+    # Gitignored secrets files in the project root; .secrets takes priority over .env
+    secrets = None
+    for potential_secret_file in [".secrets", ".env"]:
+        secrets_path = project_root / potential_secret_file
+        if secrets_path.exists():
+            secrets = {}
+            try:
+                for line in secrets_path.read_text().splitlines():
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    if "=" in line:
+                        k, v = line.split("=", 1)
+                        secrets[k.strip()] = v.strip()
+                break  # Stop after finding first valid file
+            except Exception:
+                pass
+    return secrets
+
+def _snapshot_file(src, dst, *, follow_symlinks=True):
+    """Copy one file into the sandbox, hardlinking git objects instead of copying them.
+
+    Git never rewrites an object file in place, so sharing the inode is safe;
+    everything else is copied, since workflows may rewrite tracked files.
+    """
+    if f"{os.sep}.git{os.sep}objects{os.sep}" in src:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass  # Cross-device or unsupported; fall back to a real copy
+    return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
 @pytest.fixture
-def run_act(act_bin, project_root, tmp_path):
+def run_act(act_bin, project_root, tmp_path, file_secrets):
     """Fixture to run act with simplified arguments and git isolation."""
     
     def _run(workflow=None, job=None, event_file=None, event_payload=None, secrets=None, env=None, dry_run=False, isolate=True):
@@ -66,7 +106,9 @@ def run_act(act_bin, project_root, tmp_path):
             )
             
             # Copy the project root to sandbox
-            shutil.copytree(project_root, sandbox_dir, ignore=ignore, dirs_exist_ok=True)
+            shutil.copytree(
+                project_root, sandbox_dir, ignore=ignore, copy_function=_snapshot_file, dirs_exist_ok=True
+            )
             
             # Ensure sandbox is a valid git repo (handle worktrees or missing .git)
             # This is critical for act/actions that use git commands
@@ -75,12 +117,20 @@ def run_act(act_bin, project_root, tmp_path):
                 if git_dir.exists():
                     os.remove(git_dir) # Remove worktree file if it exists
                 
-                # Initialize fresh repo to satisfy git dependencies
-                subprocess.run(["git", "init"], cwd=sandbox_dir, check=True)
-                subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=sandbox_dir, check=True)
-                subprocess.run(["git", "config", "user.name", "Test User"], cwd=sandbox_dir, check=True)
-                subprocess.run(["git", "add", "."], cwd=sandbox_dir, check=True)
-                subprocess.run(["git", "commit", "-m", "Sandbox setup"], cwd=sandbox_dir, check=True)
+                # Initialize fresh repo to satisfy git dependencies, in one shell
+                # rather than a process per git command
+                subprocess.run(
+                    [
+                        "sh", "-c",
+                        "git init"
+                        " && git config user.email test@example.com"
+                        " && git config user.name 'Test User'"
+                        " && git add ."
+                        " && git commit -m 'Sandbox setup'",
+                    ],
+                    cwd=sandbox_dir,
+                    check=True,
+                )
                 
             work_dir = sandbox_dir
 
@@ -121,24 +171,7 @@ def run_act(act_bin, project_root, tmp_path):
         # Secrets
         secrets_to_use = secrets
         if secrets_to_use is None:
-             # Check for .secrets file in project root (gitignored)
-             # User requested checking ".env (gitignored)", often named .secrets in this repo context
-             # I'll check both just in case, prioritizing .secrets as established
-             for potential_secret_file in [".secrets", ".env"]:
-                 secrets_path = project_root / potential_secret_file
-                 if secrets_path.exists():
-                     secrets_to_use = {}
-                     try:
-                         for line in secrets_path.read_text().splitlines():
-                             line = line.strip()
-                             if not line or line.startswith("#"):
-                                 continue
-                             if "=" in line:
-                                 k, v = line.split("=", 1)
-                                 secrets_to_use[k.strip()] = v.strip()
-                         break # Stop after finding first valid file
-                     except Exception:
-                         pass
+            secrets_to_use = file_secrets
 
         if secrets_to_use:
             if isinstance(secrets_to_use, list):
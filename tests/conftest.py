@@ -12,6 +12,12 @@ from github import Github
 from github.PullRequest import PullRequest
 from github.Repository import Repository
 
+# Attribute names the PyGithub mocks are limited to. Passing names rather than the
+# classes skips Mock's per-instance introspection of every PyGithub method.
+_GITHUB_SPEC = dir(Github)
+_PULL_REQUEST_SPEC = dir(PullRequest)
+_REPOSITORY_SPEC = dir(Repository)
+
 
 @pytest.fixture
 def github_token() -> str:
@@ -34,7 +40,7 @@ def pr_number() -> int:
 @pytest.fixture
 def mock_repo(repository: str) -> Mock:
     """Mock GitHub Repository object."""
-    repo = Mock(spec=Repository)
+    repo = Mock(spec=_REPOSITORY_SPEC)
     repo.full_name = repository
     repo.owner = Mock()
     repo.owner.login = "test-owner"
@@ -45,7 +51,7 @@ def mock_repo(repository: str) -> Mock:
 @pytest.fixture
 def mock_pr(mock_repo: Mock, pr_number: int) -> Mock:
     """Mock GitHub PullRequest object."""
-    pr = Mock(spec=PullRequest)
+    pr = Mock(spec=_PULL_REQUEST_SPEC)
     pr.number = pr_number
     pr.title = "Test PR"
     pr.body = "Test PR body"
@@ -75,16 +81,16 @@ def mock_pr(mock_repo: Mock, pr_number: int) -> Mock:
 @pytest.fixture
 def mock_github(mock_repo: Mock, mock_pr: Mock) -> Mock:
     """Mock Github client."""
-    gh = Mock(spec=Github)
+    gh = Mock(spec=_GITHUB_SPEC)
     gh.get_repo.return_value = mock_repo
     mock_repo.get_pull.return_value = mock_pr
     mock_repo.get_labels.return_value = []
     return gh
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_review_data() -> dict[str, Any]:
-    """Sample review data for testing."""
+    """Sample review data for testing (shared by the session; copy before mutating)."""
     return {
         "approved": True,
         "overallRisk": "LOW",
@@ -123,15 +129,15 @@ def sample_review_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_review_json(sample_review_data: dict[str, Any]) -> str:
     """Sample review JSON string."""
     return json.dumps(sample_review_data, indent=2)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_schema() -> dict[str, Any]:
-    """Sample JSON schema for review validation."""
+    """Sample JSON schema for review validation (shared by the session; copy before mutating)."""
     return {
         "$schema": "http://json-schema.org/draft-07/schema#",
         "type": "object",
@@ -164,6 +170,14 @@ def sample_schema() -> dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def sample_schema_path(tmp_path_factory: pytest.TempPathFactory, sample_schema: dict[str, Any]) -> Path:
+    """Sample schema written to disk once, so validate_review reuses its cached validator."""
+    schema_path = tmp_path_factory.mktemp("schema") / "schema.json"
+    schema_path.write_text(json.dumps(sample_schema))
+    return schema_path
+
+
 @pytest.fixture
 def workspace(tmp_path: Path) -> Path:
     """Create a temporary workspace directory structure."""
@@ -189,9 +203,9 @@ def mock_env(monkeypatch: MonkeyPatch, github_token: str, repository: str, works
     monkeypatch.setenv("GITHUB_EVENT_PATH", str(workspace / "event.json"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_changed_files() -> list[str]:
-    """Sample changed files list."""
+    """Sample changed files list (shared by the session; copy before mutating)."""
     return [
         "src/main.py",
         "src/utils.py",
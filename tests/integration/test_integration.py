@@ -4,46 +4,78 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 import json
 
+import pytest
 
 from cletus_code.run_review import ReviewOrchestrator
 from cletus_code.process_review import load_review_data, build_markdown
 
 
+@pytest.fixture(scope="class")
+def _patched_workflow():
+    """Patch subprocess and PyGithub once for a whole test class."""
+    with patch("cletus_code.run_review.subprocess.run") as mock_subprocess:
+        with patch("cletus_code.run_review.Github") as mock_github:
+            yield mock_subprocess, mock_github
+
+
+@pytest.fixture
+def workflow_mocks(_patched_workflow):
+    """The class-wide subprocess and Github mocks, cleared for each test."""
+    for mock in _patched_workflow:
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _patched_workflow
+
+
+@pytest.fixture
+def mock_pr_repo(workflow_mocks, repository: str):
+    """Factory for a PR and its repository, served through the patched Github client.
+
+    On pull_request events the orchestrator builds the PR from the event payload
+    with create_from_raw_data, so that is where the PR mock is wired.
+    """
+    _, mock_github = workflow_mocks
+
+    def _make(title="Test PR", head_ref="feature", login="developer"):
+        mock_repo = Mock()
+        mock_repo.full_name = repository
+        mock_pr = Mock()
+        mock_pr.number = 42
+        mock_pr.title = title
+        mock_pr.head.ref = head_ref
+        mock_pr.head.sha = "abc123"
+        mock_pr.base.ref = "main"
+        mock_pr.base.sha = "def456"
+        mock_pr.user.login = login
+        mock_pr.is_merged.return_value = False
+
+        mock_repo.get_labels.return_value = []
+        mock_repo.get_pull.side_effect = AssertionError("PR should come from the event payload")
+        mock_github.return_value.get_repo.return_value = mock_repo
+        mock_github.return_value.create_from_raw_data.return_value = mock_pr
+        return mock_repo, mock_pr
+
+    return _make
+
+
 class TestReviewWorkflow:
     """Integration tests for the complete review workflow."""
 
-    @patch("cletus_code.run_review.subprocess.run")
-    @patch("cletus_code.run_review.Github")
     def test_full_review_workflow(
         self,
-        mock_github: Mock,
-        mock_subprocess: Mock,
+        workflow_mocks: tuple[Mock, Mock],
+        mock_pr_repo,
         github_token: str,
-        repository: str,
         workspace: Path,
         sample_changed_files: list[str],
         mock_env: None,
         mock_event_payload: None,
     ):
         """Test the complete review workflow from start to finish."""
+        mock_subprocess, _ = workflow_mocks
         # Setup mocks
         mock_subprocess.return_value = Mock(returncode=0, stdout="", stderr="")
 
-        mock_repo = Mock()
-        mock_repo.full_name = repository
-        mock_pr = Mock()
-        mock_pr.number = 42
-        mock_pr.title = "Test PR"
-        mock_pr.head.ref = "feature-branch"
-        mock_pr.head.sha = "abc123"
-        mock_pr.base.ref = "main"
-        mock_pr.base.sha = "def456"
-        mock_pr.user.login = "test-user"
-        mock_pr.is_merged.return_value = False
-
-        mock_repo.get_pull.return_value = mock_pr
-        mock_repo.get_labels.return_value = []
-        mock_github.return_value.get_repo.return_value = mock_repo
+        mock_pr_repo(head_ref="feature-branch", login="test-user")
 
         # Create review.json in output (simulating Claude Code output)
         review_data = {
@@ -84,20 +116,18 @@ class TestReviewWorkflow:
         assert "LGTM!" in markdown
         assert "Approved" in markdown
 
-    @patch("cletus_code.run_review.subprocess.run")
-    @patch("cletus_code.run_review.Github")
     def test_workflow_with_kustomize_plugin(
         self,
-        mock_github: Mock,
-        mock_subprocess: Mock,
+        workflow_mocks: tuple[Mock, Mock],
+        mock_pr_repo,
         github_token: str,
-        repository: str,
         workspace: Path,
         mock_kustomize_files: None,
         mock_env: None,
         mock_event_payload: None,
     ):
         """Test workflow with kustomize plugin generating diffs."""
+        mock_subprocess, _ = workflow_mocks
         # Mock kubectl responses
         def mock_kubectl(args, **kwargs):
             result = Mock()
@@ -111,22 +141,7 @@ class TestReviewWorkflow:
 
         mock_subprocess.side_effect = mock_kubectl
 
-        mock_repo = Mock()
-        mock_repo.full_name = repository
-        mock_pr = Mock()
-        mock_pr.number = 42
-        mock_pr.title = "Update k8s manifests"
-        mock_pr.head.ref = "feature"
-        mock_pr.head.sha = "abc123"
-        mock_pr.base.ref = "main"
-        mock_pr.base.sha = "def456"
-        mock_pr.user.login = "developer"
-        mock_pr.is_merged.return_value = False
-        mock_pr.create_issue_comment.return_value = Mock()
-
-        mock_repo.get_pull.return_value = mock_pr
-        mock_repo.get_labels.return_value = []
-        mock_github.return_value.get_repo.return_value = mock_repo
+        _, mock_pr = mock_pr_repo(title="Update k8s manifests")
 
         orchestrator = ReviewOrchestrator(
             github_token=github_token,
@@ -144,38 +159,21 @@ class TestReviewWorkflow:
         assert results[0].comment_content is not None
         assert "## Kustomize Diff Preview" in results[0].comment_content
 
-    @patch("cletus_code.run_review.subprocess.run")
-    @patch("cletus_code.run_review.Github")
     def test_workflow_with_review_rejection(
         self,
-        mock_github: Mock,
-        mock_subprocess: Mock,
+        workflow_mocks: tuple[Mock, Mock],
+        mock_pr_repo,
         github_token: str,
-        repository: str,
         workspace: Path,
         sample_changed_files: list[str],
         mock_env: None,
         mock_event_payload: None,
     ):
         """Test workflow when review is not approved."""
+        mock_subprocess, _ = workflow_mocks
         mock_subprocess.return_value = Mock(returncode=0)
 
-        mock_repo = Mock()
-        mock_repo.full_name = repository
-        mock_pr = Mock()
-        mock_pr.number = 42
-        mock_pr.title = "Add feature"
-        mock_pr.head.ref = "feature"
-        mock_pr.head.sha = "abc123"
-        mock_pr.base.ref = "main"
-        mock_pr.base.sha = "def456"
-        mock_pr.user.login = "developer"
-        mock_pr.is_merged.return_value = False
-        mock_pr.create_issue_comment.return_value = Mock()
-
-        mock_repo.get_pull.return_value = mock_pr
-        mock_repo.get_labels.return_value = []
-        mock_github.return_value.get_repo.return_value = mock_repo
+        _, mock_pr = mock_pr_repo(title="Add feature")
 
         # Create a rejection review
         review_data = {
@@ -215,23 +213,30 @@ class TestReviewWorkflow:
         assert "HIGH" in markdown
         assert "Security vulnerability" in markdown
 
+        # The review comment landing on mock_pr shows the orchestrator used it
+        mock_pr.create_issue_comment.assert_called_once()
+
         # Verify PR was NOT merged (no approval/merge calls)
         mock_pr.create_review.assert_not_called()
         mock_pr.merge.assert_not_called()
 
-    def test_skill_loading_with_k8s_repo(
+    @pytest.mark.parametrize(
+        "repo,expected_name",
+        [("owner/k8s", "k8s-argocd-review"), ("owner/my-service", None)],
+    )
+    def test_skill_name_detection(
         self,
         github_token: str,
         workspace: Path,
+        repo: str,
+        expected_name: str | None,
     ):
-        """Test skill loading for k8s repository."""
+        """Test repo-specific skill detection from the repository name."""
         from cletus_code.skills import SkillLoader
 
-        loader = SkillLoader(workspace, "owner/k8s", github_token)
+        loader = SkillLoader(workspace, repo, github_token)
 
-        # Should detect k8s repo
-        skill_name = loader._get_repo_skill_name()
-        assert skill_name == "k8s-argocd-review"
+        assert loader._get_repo_skill_name() == expected_name
 
     def test_skill_loading_with_generic_repo(
         self,
@@ -243,10 +248,6 @@ class TestReviewWorkflow:
 
         loader = SkillLoader(workspace, "owner/my-service", github_token)
 
-        # Should not detect specific skill
-        skill_name = loader._get_repo_skill_name()
-        assert skill_name is None
-
         # Should fall back to default
         with patch.object(loader, "_load_from_central_repo", return_value=None):
             skill = loader.load_skill()
@@ -257,7 +258,9 @@ class TestReviewWorkflow:
 class TestEndToEndReviewProcessing:
     """Tests for complete review processing pipeline."""
 
-    def test_load_validate_and_build_review(self, workspace: Path, sample_review_data: dict):
+    def test_load_validate_and_build_review(
+        self, workspace: Path, sample_review_data: dict, sample_schema_path: Path
+    ):
         """Test the full pipeline: load, validate, build markdown."""
         import json
         from cletus_code.process_review import validate_review
@@ -266,23 +269,9 @@ class TestEndToEndReviewProcessing:
         review_path = workspace / "review.json"
         review_path.write_text(json.dumps(sample_review_data))
 
-        schema_path = workspace / "schema.json"
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "required": ["approved", "overallRisk", "summary"],
-            "properties": {
-                "approved": {"type": "boolean"},
-                "overallRisk": {"type": "string"},
-                "summary": {"type": "string"},
-                "findings": {"type": "array"},
-            },
-        }
-        schema_path.write_text(json.dumps(schema))
-
         # Execute
         data = load_review_data(review_path)
-        errors = validate_review(data, schema_path)
+        errors = validate_review(data, sample_schema_path)
         markdown = build_markdown(data, errors, None)
 
         # Verify
@@ -292,7 +281,7 @@ class TestEndToEndReviewProcessing:
         assert "LOW" in markdown
         assert "LGTM!" in markdown
 
-    def test_review_with_validation_errors(self, workspace: Path):
+    def test_review_with_validation_errors(self, workspace: Path, sample_schema_path: Path):
         """Test review pipeline with validation errors."""
         import json
         from cletus_code.process_review import validate_review
@@ -308,22 +297,9 @@ class TestEndToEndReviewProcessing:
         review_path = workspace / "review.json"
         review_path.write_text(json.dumps(review_data))
 
-        schema_path = workspace / "schema.json"
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "type": "object",
-            "required": ["approved", "overallRisk", "summary"],
-            "properties": {
-                "approved": {"type": "boolean"},
-                "overallRisk": {"type": "string", "enum": ["LOW", "MEDIUM", "HIGH"]},
-                "summary": {"type": "string"},
-            },
-        }
-        schema_path.write_text(json.dumps(schema))
-
         # Execute
         data = load_review_data(review_path)
-        errors = validate_review(data, schema_path)
+        errors = validate_review(data, sample_schema_path)
         markdown = build_markdown(data, errors, None)
 
         # Verify
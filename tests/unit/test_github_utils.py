@@ -0,0 +1,226 @@
+"""Unit tests for github_utils module."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from github.GithubException import GithubException
+
+from cletus_code.github_utils import (
+    fetch_file_from_github_conditional,
+    fetch_files_from_github,
+    get_pull_request_refs,
+    publish_and_merge_pull_request,
+)
+
+
+def _refs_response(merge_commit=None, potential_merge_commit=None) -> tuple[dict, dict]:
+    """GraphQL answer to the PR refs query."""
+    return {}, {
+        "data": {
+            "repository": {
+                "pullRequest": {
+                    "baseRefOid": "base-sha",
+                    "headRefOid": "head-sha",
+                    "mergeCommit": merge_commit,
+                    "potentialMergeCommit": potential_merge_commit,
+                }
+            }
+        }
+    }
+
+
+def _merge_commit(*parents: str) -> dict:
+    """Merge commit node with the given parent SHAs."""
+    return {"oid": "merge-sha", "parents": {"nodes": [{"oid": oid} for oid in parents]}}
+
+
+class TestFetchFilesFromGithub:
+    """Tests for fetch_files_from_github function."""
+
+    @patch("cletus_code.github_utils.fetch_file_from_github", return_value="large file")
+    @patch("cletus_code.github_utils.Github")
+    def test_batch_query(self, mock_github: Mock, mock_fetch: Mock):
+        """Test that one query returns each file, with truncated blobs refetched over REST."""
+        mock_github.return_value.requester.graphql_query.return_value = (
+            {},
+            {
+                "data": {
+                    "repository": {
+                        "f0": {"text": "first", "isTruncated": False},
+                        "f1": None,
+                        "f2": {"text": "cut", "isTruncated": True},
+                    }
+                }
+            },
+        )
+
+        contents = fetch_files_from_github(
+            "owner/repo", [("main", "a.md"), ("main", "missing.md"), ("v1", "big.md")], "token"
+        )
+
+        assert contents == ["first", None, "large file"]
+        query, variables = mock_github.return_value.requester.graphql_query.call_args.args
+        assert "f2: object(expression: $e2)" in query
+        assert variables == {"owner": "owner", "name": "repo", "e0": "main:a.md", "e1": "main:missing.md", "e2": "v1:big.md"}
+        mock_fetch.assert_called_once_with("owner/repo", "big.md", "token", "v1")
+
+    @pytest.mark.parametrize(
+        "response",
+        [GithubException(400, {"errors": [{"message": "bad"}]}), ({}, {"data": {"repository": None}})],
+    )
+    @patch("cletus_code.github_utils.Github")
+    def test_failed_query_returns_none(self, mock_github: Mock, response):
+        """Test that a failed query or unknown repository tells callers to fetch per file."""
+        if isinstance(response, Exception):
+            mock_github.return_value.requester.graphql_query.side_effect = response
+        else:
+            mock_github.return_value.requester.graphql_query.return_value = response
+
+        assert fetch_files_from_github("owner/repo", [("main", "a.md")], "token") is None
+
+
+class TestGetPullRequestRefs:
+    """Tests for get_pull_request_refs function."""
+
+    @pytest.mark.parametrize("field", ["merge_commit", "potential_merge_commit"])
+    @patch("cletus_code.github_utils.Github")
+    def test_merge_commit_with_two_parents(self, mock_github: Mock, field: str):
+        """Test that a two-parent merge commit gives (first parent, second parent)."""
+        requester = mock_github.return_value.requester
+        requester.graphql_query.return_value = _refs_response(**{field: _merge_commit("parent-1", "parent-2")})
+
+        assert get_pull_request_refs("token", "owner/repo", 42) == ("parent-1", "parent-2")
+        assert requester.graphql_query.call_args.args[1] == {"owner": "owner", "name": "repo", "number": 42}
+
+    @patch("cletus_code.github_utils.Github")
+    def test_single_parent_falls_back_to_rest(self, mock_github: Mock):
+        """Test that a single-parent merge commit returns None, leaving it to the REST path."""
+        mock_github.return_value.requester.graphql_query.return_value = _refs_response(
+            merge_commit=_merge_commit("parent-1")
+        )
+
+        assert get_pull_request_refs("token", "owner/repo", 42) is None
+
+    @patch("cletus_code.github_utils.Github")
+    def test_no_merge_commit_uses_ref_oids(self, mock_github: Mock):
+        """Test that without a merge commit the PR's base and head SHAs are used."""
+        mock_github.return_value.requester.graphql_query.return_value = _refs_response()
+
+        assert get_pull_request_refs("token", "owner/repo", 42) == ("base-sha", "head-sha")
+
+    @patch("cletus_code.github_utils.Github")
+    def test_query_failure_returns_none(self, mock_github: Mock):
+        """Test that a failed query returns None."""
+        mock_github.return_value.requester.graphql_query.side_effect = GithubException(502, "Bad Gateway")
+
+        assert get_pull_request_refs("token", "owner/repo", 42) is None
+
+
+class TestFetchFileFromGithubConditional:
+    """Tests for fetch_file_from_github_conditional function."""
+
+    @patch("cletus_code.github_utils.Github")
+    def test_not_modified(self, mock_github: Mock):
+        """Test that the ETag is sent and a 304 carries no content."""
+        requester = mock_github.return_value.requester
+        requester.requestJson.return_value = (304, {}, "")
+
+        result = fetch_file_from_github_conditional("owner/repo", "skills/a b.md", "token", "v1", '"v1"')
+
+        assert result == (304, None, None)
+        args, kwargs = requester.requestJson.call_args
+        assert args == ("GET", "/repos/owner/repo/contents/skills/a%20b.md")
+        assert kwargs["parameters"] == {"ref": "v1"}
+        assert kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    @patch("cletus_code.github_utils.Github")
+    def test_modified(self, mock_github: Mock):
+        """Test that changed content comes back with its new ETag."""
+        requester = mock_github.return_value.requester
+        requester.requestJson.return_value = (200, {"etag": '"v2"'}, "content")
+
+        result = fetch_file_from_github_conditional("owner/repo", "SKILL.md", "token")
+
+        assert result == (200, '"v2"', "content")
+        assert "If-None-Match" not in requester.requestJson.call_args.kwargs["headers"]
+
+    @pytest.mark.parametrize("status", [404, 500])
+    @patch("cletus_code.github_utils.Github")
+    def test_error_status(self, mock_github: Mock, status: int):
+        """Test that error statuses are passed through without content."""
+        mock_github.return_value.requester.requestJson.return_value = (status, {}, '{"message": "Not Found"}')
+
+        assert fetch_file_from_github_conditional("owner/repo", "SKILL.md", "token") == (status, None, None)
+
+    @patch("cletus_code.github_utils.Github")
+    def test_request_failure(self, mock_github: Mock):
+        """Test that a request that never got an answer reports status 0."""
+        mock_github.return_value.requester.requestJson.side_effect = ConnectionError("reset")
+
+        assert fetch_file_from_github_conditional("owner/repo", "SKILL.md", "token") == (0, None, None)
+
+
+class TestPublishAndMergePullRequest:
+    """Tests for publish_and_merge_pull_request function."""
+
+    @patch("cletus_code.github_utils.Github")
+    def test_comment_approve_and_merge(self, mock_github: Mock):
+        """Test that the merge is sent once comment and approval succeed."""
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.return_value = (
+            {},
+            {"data": {"comment": {"clientMutationId": None}, "approve": {"pullRequestReview": {"state": "APPROVED"}}}},
+        )
+        requester.graphql_query.return_value = ({}, {"data": {"merge": {"pullRequest": {"merged": True}}}})
+
+        result = publish_and_merge_pull_request("token", "PR_node", "LGTM", "Approved")
+
+        assert (result.commented, result.approved, result.merged) == (True, True, True)
+        variables = requester.requestJsonAndCheck.call_args.kwargs["input"]["variables"]
+        assert variables["comment"] == "LGTM"
+        assert variables["withComment"] is True
+        requester.graphql_query.assert_called_once()
+
+    @patch("cletus_code.github_utils.Github")
+    def test_failed_approve_skips_merge(self, mock_github: Mock):
+        """Test that a PR is never merged when the approval fails."""
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.return_value = (
+            {},
+            {
+                "data": {"comment": {"clientMutationId": None}, "approve": None},
+                "errors": [{"message": "Review cannot be requested"}],
+            },
+        )
+
+        result = publish_and_merge_pull_request("token", "PR_node", "LGTM", "Approved")
+
+        assert (result.commented, result.approved, result.merged) == (True, False, False)
+        requester.graphql_query.assert_not_called()
+
+    @patch("cletus_code.github_utils.Github")
+    def test_failed_request_reports_nothing_done(self, mock_github: Mock):
+        """Test that a failed comment and approval request leaves every step to the caller."""
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.side_effect = GithubException(502, "Bad Gateway")
+
+        result = publish_and_merge_pull_request("token", "PR_node", None, "Approved")
+
+        assert (result.commented, result.approved, result.merged) == (False, False, False)
+        requester.graphql_query.assert_not_called()
+
+    @patch("cletus_code.github_utils.Github")
+    def test_failed_merge_keeps_approval(self, mock_github: Mock):
+        """Test that a failed merge still reports the approval, so it is not repeated."""
+        requester = mock_github.return_value.requester
+        requester.requestJsonAndCheck.return_value = (
+            {},
+            {"data": {"approve": {"pullRequestReview": {"state": "APPROVED"}}}},
+        )
+        requester.graphql_query.side_effect = GithubException(400, {"errors": [{"message": "Not mergeable"}]})
+
+        result = publish_and_merge_pull_request("token", "PR_node", None, "Approved")
+
+        assert (result.commented, result.approved, result.merged) == (False, True, False)
+        variables = requester.requestJsonAndCheck.call_args.kwargs["input"]["variables"]
+        assert variables["withComment"] is False
@@ -108,13 +108,105 @@ class TestReviewOrchestrator:
         assert context["head_sha"] == "abc123def456"
         assert context["event_name"] == "pull_request"
 
+    @patch("github.Requester.Requester.requestJsonAndCheck")
+    def test_get_pull_request_uses_event_payload(
+        self,
+        mock_request: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        mock_env: None,
+        mock_event_payload: None,
+    ):
+        """Test that the PR is built from the event payload without an API request."""
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+        context = orchestrator._setup_pr_context()
+
+        pr = orchestrator._get_pull_request(context["pr_number"])
+
+        assert pr.number == 42
+        assert pr.title == "Test PR"
+        assert pr.head.ref == "feature-branch"
+        assert pr.user.login == "test-user"
+        mock_request.assert_not_called()
+
+    @patch("cletus_code.run_review.Github")
+    def test_init_reads_settings_from_env_mapping(
+        self,
+        mock_github: Mock,
+        github_token: str,
+        workspace: Path,
+        monkeypatch,
+    ):
+        """Test that an explicit env mapping is used instead of os.environ."""
+        monkeypatch.setenv("GITHUB_REPOSITORY", "other/repo")
+        monkeypatch.setenv("GIT_CONFIG_COUNT", "5")
+        monkeypatch.delenv("DRY_RUN", raising=False)
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+            env={
+                "GITHUB_REPOSITORY": "owner/snapshot",
+                "DRY_RUN": "true",
+                "CLETUS_SKILL_CACHE_DIR": str(workspace / "skills"),
+                "GIT_CONFIG_COUNT": "1",
+            },
+        )
+
+        assert orchestrator.repository == "owner/snapshot"
+        assert orchestrator.dry_run is True
+        assert orchestrator.skill_cache_dir == workspace / "skills"
+        mock_github.return_value.get_repo.assert_called_once_with("owner/snapshot")
+        # git runs with the given environment, not os.environ
+        assert orchestrator._git_env["GIT_CONFIG_COUNT"] == "2"
+        assert "GIT_CONFIG_KEY_1" in orchestrator._git_env
+        assert "PATH" not in orchestrator._git_env
+
+    @patch("cletus_code.run_review.get_pull_request_refs", return_value=("base-sha", "head-sha"))
+    @patch("cletus_code.run_review.Github")
+    def test_setup_pr_context_reads_env_mapping(
+        self,
+        mock_github: Mock,
+        mock_get_refs: Mock,
+        github_token: str,
+        workspace: Path,
+        monkeypatch,
+    ):
+        """Test that the event name and PR number come from the env mapping."""
+        monkeypatch.setenv("REVIEW_PR_NUMBER", "99")
+        monkeypatch.setenv("GITHUB_EVENT_NAME", "pull_request")
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+            env={
+                "GITHUB_REPOSITORY": "owner/snapshot",
+                "GITHUB_EVENT_NAME": "workflow_dispatch",
+                "REVIEW_PR_NUMBER": "7",
+            },
+        )
+
+        context = orchestrator._setup_pr_context()
+
+        assert context["pr_number"] == 7
+        mock_get_refs.assert_called_once_with(github_token, "owner/snapshot", 7)
+
     @patch("cletus_code.run_review._resolve_pr_number")
     @patch("cletus_code.run_review.get_pull_request_context")
     @patch("cletus_code.run_review.resolve_rebase_refs")
+    @patch("cletus_code.run_review.get_pull_request_refs", return_value=None)
     @patch("cletus_code.run_review.Github")
     def test_setup_pr_context_for_workflow_dispatch(
         self,
         mock_github: Mock,
+        mock_get_refs: Mock,
         mock_resolve_refs: Mock,
         mock_get_context: Mock,
         mock_resolve_pr: Mock,
@@ -154,6 +246,113 @@ class TestReviewOrchestrator:
         assert context["head_sha"] == "resolved_head"
         assert context["event_name"] == "workflow_dispatch"
 
+    @patch("cletus_code.run_review._resolve_pr_number", return_value=42)
+    @patch("cletus_code.run_review.get_pull_request_context")
+    @patch("cletus_code.run_review.resolve_rebase_refs")
+    @patch("cletus_code.run_review.get_pull_request_refs", return_value=("gql_base", "gql_head"))
+    @patch("cletus_code.run_review.Github")
+    def test_setup_pr_context_for_workflow_dispatch_graphql(
+        self,
+        mock_github: Mock,
+        mock_get_refs: Mock,
+        mock_resolve_refs: Mock,
+        mock_get_context: Mock,
+        mock_resolve_pr: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        monkeypatch,
+    ):
+        """Test that workflow_dispatch skips the REST calls when GraphQL resolves refs."""
+        monkeypatch.setenv("GITHUB_EVENT_NAME", "workflow_dispatch")
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+
+        context = orchestrator._setup_pr_context()
+
+        assert context["base_sha"] == "gql_base"
+        assert context["head_sha"] == "gql_head"
+        mock_get_refs.assert_called_once_with(github_token, repository, 42)
+        mock_get_context.assert_not_called()
+        mock_resolve_refs.assert_not_called()
+
+    @patch("cletus_code.run_review.Github")
+    def test_setup_pr_context_parses_event_once(
+        self,
+        mock_github: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        monkeypatch,
+    ):
+        """Test that the event payload is parsed once and re-read when it changes."""
+        import json
+        import os
+
+        from cletus_code import github_utils
+
+        event_path = workspace / "event.json"
+        event = {"number": 7, "pull_request": {"number": 7, "base": {"sha": "b1"}, "head": {"sha": "h1"}}}
+        event_path.write_text(json.dumps(event))
+        monkeypatch.setenv("GITHUB_EVENT_NAME", "pull_request")
+        monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_path))
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+        monkeypatch.delenv("REVIEW_PR_NUMBER", raising=False)
+        github_utils._parse_event_file.cache_clear()
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+
+        with patch("cletus_code.github_utils.json.load", wraps=json.load) as mock_load:
+            context = orchestrator._setup_pr_context()
+
+            assert context["pr_number"] == 7
+            assert context["head_sha"] == "h1"
+            assert mock_load.call_count == 1
+
+            event["pull_request"]["head"]["sha"] = "h2"
+            event_path.write_text(json.dumps(event))
+            os.utime(event_path, ns=(1, 1))
+
+            assert orchestrator._setup_pr_context()["head_sha"] == "h2"
+            assert mock_load.call_count == 2
+
+    @patch("cletus_code.run_review.get_pull_request_context")
+    @patch("cletus_code.run_review.Github")
+    def test_setup_pr_context_uses_api_for_other_pr(
+        self,
+        mock_github: Mock,
+        mock_get_context: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        mock_env: None,
+        mock_event_payload: None,
+        monkeypatch,
+    ):
+        """Test that a REVIEW_PR_NUMBER override does not reuse the payload of another PR."""
+        monkeypatch.setenv("REVIEW_PR_NUMBER", "99")
+        mock_get_context.return_value = {"pr_number": 99, "base_sha": "base99", "head_sha": "head99"}
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+        context = orchestrator._setup_pr_context()
+
+        assert context["head_sha"] == "head99"
+        assert orchestrator._pr_payload is None
+        mock_get_context.assert_called_once_with(github_token, repository, 99)
+
     @patch("cletus_code.run_review.subprocess.run")
     @patch("cletus_code.run_review.Github")
     def test_checkout_branches(
@@ -166,6 +365,8 @@ class TestReviewOrchestrator:
         monkeypatch,
     ):
         """Test branch checkout process."""
+        import base64
+
         monkeypatch.setenv("GITHUB_REPOSITORY", repository)
         mock_subprocess.return_value = Mock(returncode=0)
         mock_repo = Mock()
@@ -190,8 +391,118 @@ class TestReviewOrchestrator:
         assert orchestrator.pr_dir.exists()
         assert orchestrator.base_dir.exists()
 
-        # Verify git commands were called
-        assert mock_subprocess.call_count >= 6  # init, remote, fetch, checkout for each branch
+        # Verify git commands were called: one shared fetch, then the PR worktree
+        commands = [c.args[0][1:] for c in mock_subprocess.call_args_list]
+        assert commands[0] == ["init", "--bare"]
+        assert commands[1][:3] == ["fetch", "--depth", "1"]
+        assert commands[1][-2:] == ["head456", "base123"]
+        parallel = ["-c", "checkout.workers=0"]
+        assert [*parallel, "worktree", "add", "--detach", str(orchestrator.pr_dir), "head456"] in commands
+        base_worktree = [*parallel, "worktree", "add", "--detach", str(orchestrator.base_dir), "base123"]
+        assert base_worktree not in commands
+
+        # The token reaches git as an auth header in the environment, never in argv
+        assert f"https://github.com/{repository}.git" in commands[1]
+        assert not any(github_token in arg for command in commands for arg in command)
+        fetch_env = mock_subprocess.call_args_list[1].kwargs["env"]
+        header = fetch_env[f"GIT_CONFIG_VALUE_{int(fetch_env['GIT_CONFIG_COUNT']) - 1}"]
+        assert base64.b64decode(header.split()[-1]).decode() == f"x-access-token:{github_token}"
+
+        # The base worktree is added on demand, once
+        orchestrator._ensure_base_checkout()
+        orchestrator._ensure_base_checkout()
+        commands = [c.args[0][1:] for c in mock_subprocess.call_args_list]
+        assert commands.count(base_worktree) == 1
+
+    @patch("cletus_code.run_review.subprocess.run")
+    @patch("cletus_code.run_review.Github")
+    def test_checkout_branches_sparse(
+        self,
+        mock_github: Mock,
+        mock_subprocess: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        monkeypatch,
+    ):
+        """Test that opt-in sparse checkout limits worktrees to changed directories."""
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+        monkeypatch.setenv("CLETUS_SPARSE_CHECKOUT", "true")
+        mock_subprocess.return_value = Mock(returncode=0)
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=["k8s/app/deployment.yaml", "k8s/app/service.yaml", "README.md"],
+            workspace_root=workspace,
+        )
+
+        assert orchestrator._sparse_checkout_dirs() == ["k8s/app"]
+
+        orchestrator._checkout_branches({"pr_number": 42, "base_sha": "base123", "head_sha": "head456"})
+
+        commands = [c.args[0][1:] for c in mock_subprocess.call_args_list]
+        assert ["fetch", "--depth", "1", "--filter=blob:none", "origin", "head456", "base123"] in commands
+        assert commands.count(["sparse-checkout", "set", "--cone", "k8s/app"]) == 1
+
+        orchestrator._ensure_base_checkout()
+
+        commands = [c.args[0][1:] for c in mock_subprocess.call_args_list]
+        assert commands.count(["sparse-checkout", "set", "--cone", "k8s/app"]) == 2
+
+    @patch("cletus_code.run_review.subprocess.run")
+    @patch("cletus_code.run_review.Github")
+    def test_checkout_branches_reuses_shared_git_cache(
+        self,
+        mock_github: Mock,
+        mock_subprocess: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        tmp_path: Path,
+        monkeypatch,
+    ):
+        """Test that an existing per-repository cache is pruned and reused, not re-initialized."""
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+        monkeypatch.setenv("CLETUS_GIT_CACHE_DIR", str(tmp_path / "cache"))
+        mock_subprocess.return_value = Mock(returncode=0)
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+
+        assert orchestrator.git_cache_dir == tmp_path / "cache" / f"{repository}.git"
+        orchestrator.git_cache_dir.mkdir(parents=True)
+        (orchestrator.git_cache_dir / "HEAD").write_text("ref: refs/heads/main\n")
+
+        orchestrator._checkout_branches({"pr_number": 42, "base_sha": "base123", "head_sha": "head456"})
+
+        commands = [c.args[0][1:] for c in mock_subprocess.call_args_list]
+        assert ["init", "--bare"] not in commands
+        assert commands[0] == ["worktree", "prune"]
+        assert commands[1][:3] == ["fetch", "--depth", "1"]
+
+    @patch("cletus_code.run_review.Github")
+    def test_sparse_checkout_dirs_disabled_by_default(
+        self,
+        mock_github: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        monkeypatch,
+    ):
+        """Test that sparse checkout is off unless explicitly enabled."""
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+        monkeypatch.delenv("CLETUS_SPARSE_CHECKOUT", raising=False)
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=["k8s/app/deployment.yaml"],
+            workspace_root=workspace,
+        )
+
+        assert orchestrator._sparse_checkout_dirs() == []
 
     @patch("cletus_code.run_review.subprocess.run")
     @patch("cletus_code.run_review.Github")
@@ -237,6 +548,95 @@ class TestReviewOrchestrator:
         assert pr_dir.exists()
         assert base_dir.exists()
 
+    @patch("cletus_code.run_review.subprocess.run")
+    @patch("cletus_code.run_review.Github")
+    def test_checkout_branches_propagates_git_failure(
+        self,
+        mock_github: Mock,
+        mock_subprocess: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        monkeypatch,
+    ):
+        """Test that a failing git command aborts the checkout."""
+        import subprocess
+
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+
+        def fake_git(args, cwd=None, **kwargs):
+            if "worktree" in args and str(workspace / "pull-request") in args:
+                raise subprocess.CalledProcessError(128, args, stderr=b"fatal: bad object")
+            return Mock(returncode=0)
+
+        mock_subprocess.side_effect = fake_git
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+
+        pr_context = {
+            "pr_number": 42,
+            "base_sha": "base123",
+            "head_sha": "head456",
+        }
+
+        with pytest.raises(subprocess.CalledProcessError):
+            orchestrator._checkout_branches(pr_context)
+
+    @patch("cletus_code.run_review.Github")
+    def test_run_overlaps_checkout_with_skill_loading(
+        self,
+        mock_github: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        mock_pr: Mock,
+        monkeypatch,
+    ):
+        """Test that skills load while the checkout runs, and plugins wait for it."""
+        import threading
+
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+
+        skill_loading = threading.Event()
+        calls = []
+
+        def checkout(pr_context):
+            # Only completes if skill loading starts before the checkout ends
+            assert skill_loading.wait(timeout=5)
+            calls.append("checkout")
+
+        def load_skill():
+            skill_loading.set()
+            calls.append("skill")
+            return "skill"
+
+        def run_plugins(pr):
+            calls.append("plugins")
+            return []
+
+        with (
+            patch.object(orchestrator, "_setup_pr_context", return_value={"pr_number": 1}),
+            patch.object(orchestrator, "_get_pull_request", return_value=mock_pr),
+            patch.object(orchestrator, "_checkout_branches", side_effect=checkout),
+            patch.object(orchestrator, "_load_skill", side_effect=load_skill),
+            patch.object(orchestrator, "_run_plugins", side_effect=run_plugins),
+            patch.object(orchestrator, "_invoke_claude_code"),
+            patch.object(orchestrator, "_process_review_results"),
+        ):
+            orchestrator.run()
+
+        assert calls == ["skill", "checkout", "plugins"]
+
     @patch("cletus_code.run_review.Github")
     def test_run_plugins(
         self,
@@ -270,11 +670,13 @@ class TestReviewOrchestrator:
 
         orchestrator.plugins = [mock_plugin]
 
-        results = orchestrator._run_plugins(mock_pr)
+        with patch.object(orchestrator, "_ensure_base_checkout") as mock_base_checkout:
+            results = orchestrator._run_plugins(mock_pr)
 
         assert len(results) == 1
         assert results[0].success is True
         assert results[0].message == "Test plugin executed"
+        mock_base_checkout.assert_called_once()
 
         # Verify plugin was called
         mock_plugin.detects.assert_called_once()
@@ -308,11 +710,13 @@ class TestReviewOrchestrator:
 
         orchestrator.plugins = [mock_plugin]
 
-        results = orchestrator._run_plugins(mock_pr)
+        with patch.object(orchestrator, "_ensure_base_checkout") as mock_base_checkout:
+            results = orchestrator._run_plugins(mock_pr)
 
         assert len(results) == 0
         mock_plugin.detects.assert_called_once()
         mock_plugin.execute.assert_not_called()
+        mock_base_checkout.assert_not_called()
 
     @patch("cletus_code.run_review.Github")
     def test_run_plugins_handles_exceptions(
@@ -349,6 +753,89 @@ class TestReviewOrchestrator:
         assert results[0].success is False
         assert "failed" in results[0].message.lower()
 
+    @patch("cletus_code.run_review.Github")
+    def test_run_plugins_detects_concurrently_in_order(
+        self,
+        mock_github: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        mock_pr: Mock,
+        monkeypatch,
+    ):
+        """Test that detection failures are isolated and results keep plugin order."""
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+
+        plugins = []
+        for name in ("first", "broken", "third"):
+            plugin = Mock()
+            plugin.name = name
+            plugin.detects.return_value = True
+            plugin.execute.return_value = PluginResult(success=True, message=name)
+            plugins.append(plugin)
+        plugins[1].detects.side_effect = Exception("detect failed")
+
+        orchestrator.plugins = plugins
+
+        results = orchestrator._run_plugins(mock_pr)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[0].message == "first"
+        assert "broken" in results[1].message
+        assert results[2].message == "third"
+        plugins[1].execute.assert_not_called()
+        # Each plugin receives its own context
+        assert plugins[0].detects.call_args[0][0] is not plugins[2].detects.call_args[0][0]
+
+    @patch("cletus_code.run_review.Github")
+    def test_run_plugins_executes_concurrently_in_order(
+        self,
+        mock_github: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        mock_pr: Mock,
+        monkeypatch,
+    ):
+        """Test that detected plugins execute concurrently and results keep plugin order."""
+        import threading
+
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+
+        # Both executions must be in flight at once to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        plugins = []
+        for name in ("slow", "fast"):
+            plugin = Mock()
+            plugin.name = name
+            plugin.detects.return_value = True
+
+            def execute(context, name=name):
+                barrier.wait()
+                return PluginResult(success=True, message=name)
+
+            plugin.execute.side_effect = execute
+            plugins.append(plugin)
+
+        orchestrator.plugins = plugins
+
+        results = orchestrator._run_plugins(mock_pr)
+
+        assert [r.message for r in results] == ["slow", "fast"]
+        assert all(r.success for r in results)
+
     @patch("cletus_code.run_review.Github")
     def test_build_claude_prompt(
         self,
@@ -421,6 +908,8 @@ class TestReviewOrchestrator:
         monkeypatch,
     ):
         """Test that Claude Code invocation writes prompt file."""
+        from cletus_code import run_review
+
         monkeypatch.setenv("GITHUB_REPOSITORY", repository)
         mock_repo = Mock()
         mock_repo.full_name = repository
@@ -440,8 +929,43 @@ class TestReviewOrchestrator:
         assert prompt_file.exists()
         assert prompt_file.read_text() == prompt
 
+        # The schema is linked rather than copied, and relinked on later runs
+        schema_file = orchestrator.output_dir / "review-schema.json"
+        orchestrator._invoke_claude_code(prompt)
+        source = Path(run_review.__file__).parent / "templates" / "review-schema.json"
+        assert schema_file.read_bytes() == source.read_bytes()
+
     @patch("cletus_code.run_review.Github")
-    def test_find_schema_file(
+    def test_invoke_claude_code_streams_prompt_chunks(
+        self,
+        mock_github: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        monkeypatch,
+    ):
+        """Test that a streamed prompt matches the fully built prompt."""
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+
+        skill = "# Test Skill"
+        plugin_results = [
+            PluginResult(success=True, review_context="## Plugin Context\nAdditional info."),
+        ]
+
+        orchestrator._invoke_claude_code(orchestrator._iter_claude_prompt(skill, plugin_results))
+
+        prompt_file = orchestrator.output_dir / "claude-prompt.md"
+        expected = orchestrator._build_claude_prompt(skill, plugin_results)
+        assert prompt_file.read_text() == expected
+
+    @patch("cletus_code.run_review.Github")
+    def test_schema_file(
         self,
         mock_github: Mock,
         github_token: str,
@@ -466,12 +990,12 @@ class TestReviewOrchestrator:
         schema_path.parent.mkdir(parents=True, exist_ok=True)
         schema_path.write_text("{}")
 
-        found = orchestrator._find_schema_file()
+        found = orchestrator._schema_file
 
         assert found == schema_path
 
     @patch("cletus_code.run_review.Github")
-    def test_find_schema_file_returns_none_when_not_found(
+    def test_schema_file_returns_none_when_not_found(
         self,
         mock_github: Mock,
         github_token: str,
@@ -491,7 +1015,7 @@ class TestReviewOrchestrator:
             workspace_root=workspace,
         )
 
-        found = orchestrator._find_schema_file()
+        found = orchestrator._schema_file
 
         assert found is None
 
@@ -578,3 +1102,224 @@ class TestReviewOrchestrator:
         labels = orchestrator._derive_labels({})
 
         assert isinstance(labels, dict)
+
+    @pytest.mark.parametrize(
+        "commented, approved, merged",
+        [(True, True, True), (True, True, False), (True, False, False), (False, False, False)],
+    )
+    @patch("cletus_code.run_review.delete_merged_branch")
+    @patch("cletus_code.run_review.has_bot_comment", return_value=False)
+    @patch("cletus_code.run_review.publish_and_merge_pull_request")
+    @patch("cletus_code.run_review.merge_pull_request")
+    @patch("cletus_code.run_review.approve_and_merge")
+    @patch("cletus_code.run_review.publish_comment")
+    @patch("cletus_code.run_review.apply_labels")
+    @patch("cletus_code.run_review.validate_review", return_value=[])
+    @patch("cletus_code.run_review.should_auto_merge", return_value=(True, "all"))
+    @patch("cletus_code.run_review.Github")
+    def test_process_review_results_merges_over_graphql(
+        self,
+        mock_github: Mock,
+        mock_should_merge: Mock,
+        mock_validate: Mock,
+        mock_apply: Mock,
+        mock_publish: Mock,
+        mock_approve: Mock,
+        mock_merge: Mock,
+        mock_graphql: Mock,
+        mock_has_comment: Mock,
+        mock_delete_branch: Mock,
+        commented: bool,
+        approved: bool,
+        merged: bool,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        sample_review_data: dict,
+        mock_pr: Mock,
+        monkeypatch,
+    ):
+        """Test that REST only finishes the steps the GraphQL requests did not get done."""
+        import json
+
+        from cletus_code.github_utils import PublishAndMergeResult
+
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+        monkeypatch.setenv("GITHUB_EVENT_NAME", "pull_request")
+        monkeypatch.delenv("REVIEW_SKIP_MERGE", raising=False)
+        mock_graphql.return_value = PublishAndMergeResult(commented, approved, merged)
+        mock_pr.node_id = "PR_node"
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+        (orchestrator.output_dir / "review.json").write_text(json.dumps(sample_review_data))
+
+        orchestrator._process_review_results(mock_pr)
+
+        mock_has_comment.assert_called_once_with(mock_pr)
+        mock_graphql.assert_called_once()
+        assert mock_graphql.call_args.args[1] == "PR_node"
+        assert "LGTM" in mock_graphql.call_args.args[2]
+        assert mock_publish.called is not commented
+        if mock_publish.called:
+            assert mock_publish.call_args.args[2] is False
+        # A confirmed approval is never sent again over REST
+        assert mock_approve.called is not approved
+        assert mock_merge.called is (approved and not merged)
+        assert mock_delete_branch.called is merged
+
+    @patch("cletus_code.run_review.publish_comment")
+    @patch("cletus_code.run_review.apply_labels")
+    @patch("cletus_code.run_review.Github")
+    def test_process_review_results_only_adds_missing_labels(
+        self,
+        mock_github: Mock,
+        mock_apply: Mock,
+        mock_publish: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        sample_review_data: dict,
+        mock_pr: Mock,
+        monkeypatch,
+    ):
+        """Test that labels already on the PR per the event payload are not re-applied."""
+        import json
+
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+        monkeypatch.setenv("REVIEW_SKIP_MERGE", "true")
+        monkeypatch.delenv("GITHUB_RUN_ATTEMPT", raising=False)
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+        (orchestrator.output_dir / "review.json").write_text(json.dumps(sample_review_data))
+        labels = orchestrator._derive_labels(sample_review_data)
+        assert "risk:low" in labels
+
+        orchestrator._pr_payload = {"number": 42, "labels": [{"name": name} for name in labels]}
+        orchestrator._process_review_results(mock_pr)
+        mock_apply.assert_not_called()
+
+        orchestrator._pr_payload["labels"] = [{"name": "risk:low"}]
+        orchestrator._process_review_results(mock_pr)
+        applied = mock_apply.call_args.args[1]
+        assert "risk:low" not in applied
+        assert set(applied) == set(labels) - {"risk:low"}
+
+        # A re-run replays the original payload, whose labels may be stale
+        monkeypatch.setenv("GITHUB_RUN_ATTEMPT", "2")
+        orchestrator._process_review_results(mock_pr)
+        assert set(mock_apply.call_args.args[1]) == set(labels)
+
+    @patch("cletus_code.run_review.has_bot_comment", return_value=False)
+    @patch("cletus_code.run_review.publish_comment")
+    @patch("cletus_code.run_review.apply_labels")
+    @patch("cletus_code.run_review.Github")
+    def test_process_review_results_falls_back_to_pr_checkout(
+        self,
+        mock_github: Mock,
+        mock_apply: Mock,
+        mock_publish: Mock,
+        mock_has_comment: Mock,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        sample_review_data: dict,
+        mock_pr: Mock,
+        monkeypatch,
+    ):
+        """Test that review.json is read from the PR checkout, and skipped when absent.
+
+        Plugin comments go out alone without a review, and below it otherwise.
+        """
+        import json
+
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+        monkeypatch.setenv("REVIEW_SKIP_MERGE", "true")
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+        orchestrator._process_review_results(mock_pr, "## Kustomize Diff Preview")
+        mock_publish.assert_not_called()
+        mock_pr.create_issue_comment.assert_called_once_with("## Kustomize Diff Preview")
+
+        orchestrator.pr_dir.mkdir(parents=True, exist_ok=True)
+        (orchestrator.pr_dir / "review.json").write_text(json.dumps(sample_review_data))
+        orchestrator._process_review_results(mock_pr, "## Kustomize Diff Preview")
+        mock_publish.assert_called_once()
+        comment = mock_publish.call_args.args[1]
+        assert comment.startswith((orchestrator.output_dir / "review.md").read_text())
+        assert comment.endswith("\n\n---\n\n## Kustomize Diff Preview")
+        mock_pr.create_issue_comment.assert_called_once()
+
+    @pytest.mark.parametrize("dry_run, bot_commented", [(True, False), (False, True)])
+    @patch("cletus_code.run_review.has_bot_comment")
+    @patch("cletus_code.run_review.publish_comment")
+    @patch("cletus_code.run_review.apply_labels")
+    @patch("cletus_code.run_review.Github")
+    def test_process_review_results_posts_plugin_comment_alone(
+        self,
+        mock_github: Mock,
+        mock_apply: Mock,
+        mock_publish: Mock,
+        mock_has_comment: Mock,
+        dry_run: bool,
+        bot_commented: bool,
+        github_token: str,
+        repository: str,
+        workspace: Path,
+        sample_review_data: dict,
+        mock_pr: Mock,
+        monkeypatch,
+    ):
+        """Test that plugin output skips the review comment in dry runs and once a bot commented."""
+        import json
+
+        monkeypatch.setenv("GITHUB_REPOSITORY", repository)
+        monkeypatch.setenv("REVIEW_SKIP_MERGE", "true")
+        monkeypatch.setenv("DRY_RUN", str(dry_run).lower())
+        mock_has_comment.return_value = bot_commented
+
+        orchestrator = ReviewOrchestrator(
+            github_token=github_token,
+            changed_files=[],
+            workspace_root=workspace,
+        )
+        (orchestrator.output_dir / "review.json").write_text(json.dumps(sample_review_data))
+
+        orchestrator._process_review_results(mock_pr, "## Kustomize Diff Preview")
+
+        # The existing-comment scan happens once and is handed on to publish_comment
+        mock_has_comment.assert_called_once_with(mock_pr)
+        assert "Kustomize" not in mock_publish.call_args.args[1]
+        assert mock_publish.call_args.args[2] is bot_commented
+        if dry_run:
+            mock_pr.create_issue_comment.assert_not_called()
+        else:
+            mock_pr.create_issue_comment.assert_called_once_with("## Kustomize Diff Preview")
+
+    @pytest.mark.parametrize("review_length", [100, 60000, 65536])
+    def test_append_plugin_comment_fits_comment_limit(self, review_length: int):
+        """Test that plugin output is cut so the combined comment stays within GitHub's limit."""
+        from cletus_code.process_review import COMMENT_MAX_LENGTH, TRUNCATION_SUFFIX
+        from cletus_code.run_review import _append_plugin_comment
+
+        markdown = "r" * review_length
+        comment = _append_plugin_comment(markdown, "p" * COMMENT_MAX_LENGTH)
+
+        assert comment.startswith(markdown)
+        if review_length < COMMENT_MAX_LENGTH:
+            assert len(comment) == COMMENT_MAX_LENGTH
+            assert comment.endswith(TRUNCATION_SUFFIX)
+        else:
+            assert comment == markdown
+        assert _append_plugin_comment("review", "plugin") == "review\n\n---\n\nplugin"
@@ -14,6 +14,10 @@ from cletus_code.process_review import (
     _parse_pr_number,
     _should_skip_merge,
     find_file_in_workspace,
+    truncate_comment,
+    publish_comment,
+    COMMENT_MAX_LENGTH,
+    TRUNCATION_SUFFIX,
 )
 
 
@@ -133,6 +137,26 @@ class TestValidateReview:
 
         assert len(errors) > 0
 
+    def test_validate_reloads_edited_schema(self, workspace: Path, sample_schema: dict):
+        """Test that the cached validator is rebuilt when the schema file changes."""
+        import json
+        import os
+
+        schema_path = workspace / "schema.json"
+        schema_path.write_text(json.dumps(sample_schema))
+        review = {"approved": True, "overallRisk": "LOW", "summary": "Test"}
+
+        assert validate_review(review, schema_path) == validate_review(review, schema_path)
+
+        stricter = dict(sample_schema, required=[*sample_schema.get("required", []), "extra"])
+        schema_path.write_text(json.dumps(stricter))
+        stat = schema_path.stat()
+        os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        errors = validate_review(review, schema_path)
+
+        assert any("extra" in error for error in errors)
+
     def test_validate_schema_file_not_found(self, workspace: Path, sample_review_data: dict):
         """Test validation when schema file doesn't exist."""
         schema_path = workspace / "nonexistent.json"
@@ -227,6 +251,48 @@ class TestDeriveLabels:
         assert "risk:unknown" in labels
 
 
+class TestTruncateComment:
+    """Tests for truncate_comment function."""
+
+    def test_short_comment_unchanged(self):
+        """Test that comments within the limit are left alone."""
+        markdown = "x" * COMMENT_MAX_LENGTH
+
+        assert truncate_comment(markdown) is markdown
+
+    def test_truncated_comment_fits_limit(self):
+        """Test that the truncation suffix counts toward the limit."""
+        truncated = truncate_comment("x" * (COMMENT_MAX_LENGTH + 1))
+
+        assert len(truncated) == COMMENT_MAX_LENGTH
+        assert truncated.endswith(TRUNCATION_SUFFIX)
+
+
+class TestPublishComment:
+    """Tests for publish_comment function."""
+
+    @pytest.mark.parametrize("already_commented", [True, False])
+    @patch("cletus_code.process_review.has_bot_comment")
+    def test_known_comment_state_skips_lookup(self, mock_has_comment: Mock, already_commented: bool):
+        """Test that a caller's earlier existing-comment check is not repeated."""
+        pr = Mock()
+
+        publish_comment(pr, "## Review", already_commented)
+
+        mock_has_comment.assert_not_called()
+        assert pr.create_issue_comment.called is not already_commented
+
+    @patch("cletus_code.process_review.has_bot_comment", return_value=True)
+    def test_looks_up_existing_comment_by_default(self, mock_has_comment: Mock):
+        """Test that an existing bot comment is looked up when the caller has not checked."""
+        pr = Mock()
+
+        publish_comment(pr, "## Review")
+
+        mock_has_comment.assert_called_once_with(pr)
+        pr.create_issue_comment.assert_not_called()
+
+
 class TestShouldAutoMerge:
     """Tests for should_auto_merge function."""
 
@@ -345,6 +411,12 @@ class TestShouldSkipMerge:
         """Test skip merge when conditions are false."""
         assert _should_skip_merge() is False
 
+    @patch.dict("os.environ", {"GITHUB_EVENT_NAME": "pull_request", "REVIEW_SKIP_MERGE": "false"})
+    def test_skip_merge_env_mapping(self):
+        """Test that an explicit env mapping is read instead of os.environ."""
+        assert _should_skip_merge({"GITHUB_EVENT_NAME": "workflow_dispatch"}) is True
+        assert _should_skip_merge({}) is False
+
 
 class TestFindFileInWorkspace:
     """Tests for find_file_in_workspace function."""
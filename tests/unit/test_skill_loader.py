@@ -0,0 +1,317 @@
+"""Unit tests for the skill loader's fetching and caching."""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cletus_code.skills import SkillLoader, DEFAULT_PR_REVIEW_SKILL, loader
+from cletus_code.skills.loader import _cached_fetch, _disk_skill_file, _http_session
+
+
+@pytest.fixture(autouse=True)
+def _clear_skill_caches():
+    """Start every test with empty process-wide skill caches."""
+    loader._github_skill_cache.clear()
+    SkillLoader._default_skills_text = None
+    yield
+    loader._github_skill_cache.clear()
+    SkillLoader._default_skills_text = None
+
+
+@pytest.fixture
+def skill_loader(workspace: Path, github_token: str) -> SkillLoader:
+    """SkillLoader for the test workspace, without a disk cache."""
+    return SkillLoader(workspace_root=workspace, repository="owner/repo", github_token=github_token)
+
+
+class TestGithubSkillCache:
+    """Tests for the in-process GitHub skill cache."""
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github")
+    def test_fetch_reused_within_ttl(self, mock_fetch: Mock):
+        """Test that a skill is fetched once while it is within the TTL."""
+        mock_fetch.return_value = "skill"
+
+        assert _cached_fetch("owner/repo", "SKILL.md", "token", "main") == "skill"
+        assert _cached_fetch("owner/repo", "SKILL.md", "token", "main") == "skill"
+
+        mock_fetch.assert_called_once()
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github", return_value=None)
+    def test_misses_are_cached(self, mock_fetch: Mock):
+        """Test that a missing skill is not looked up again within the TTL."""
+        assert _cached_fetch("owner/repo", "SKILL.md", "token", "main") is None
+        assert _cached_fetch("owner/repo", "SKILL.md", "token", "main") is None
+
+        mock_fetch.assert_called_once()
+
+    @patch("cletus_code.skills.loader._GITHUB_SKILL_TTL", 0.0)
+    @patch("cletus_code.skills.loader.fetch_file_from_github", return_value="skill")
+    def test_expired_entry_refetched(self, mock_fetch: Mock):
+        """Test that an entry older than the TTL is fetched again."""
+        _cached_fetch("owner/repo", "SKILL.md", "token", "main")
+        _cached_fetch("owner/repo", "SKILL.md", "token", "main")
+
+        assert mock_fetch.call_count == 2
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github", return_value="skill")
+    def test_cache_keyed_by_ref_and_token(self, mock_fetch: Mock):
+        """Test that other refs and tokens do not share an entry."""
+        _cached_fetch("owner/repo", "SKILL.md", "token", "main")
+        _cached_fetch("owner/repo", "SKILL.md", "token", "v1")
+        _cached_fetch("owner/repo", "SKILL.md", "other-token", "main")
+
+        assert mock_fetch.call_count == 3
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github", return_value="skill")
+    def test_invalidate_drops_entries(self, mock_fetch: Mock):
+        """Test that invalidate forces the next load to fetch again."""
+        _cached_fetch("owner/repo", "SKILL.md", "token", "main")
+        SkillLoader.invalidate()
+        _cached_fetch("owner/repo", "SKILL.md", "token", "main")
+
+        assert mock_fetch.call_count == 2
+
+
+class TestDiskSkillCache:
+    """Tests for the persistent GitHub skill cache."""
+
+    def test_cache_file_depends_on_token(self, tmp_path: Path):
+        """Test that different tokens never share a cached copy."""
+        first = _disk_skill_file(tmp_path, "owner/repo", "main", "SKILL.md", "token-a")
+        second = _disk_skill_file(tmp_path, "owner/repo", "main", "SKILL.md", "token-b")
+
+        assert first != second
+        assert "token-a" not in first.name
+        assert first == _disk_skill_file(tmp_path, "owner/repo", "main", "SKILL.md", "token-a")
+
+    def test_every_write_uses_its_own_temp_file(self, tmp_path: Path):
+        """Test that content and ETag never share a temp file, even within one process.
+
+        Threads of one run can write the same cache file; a shared temp path let
+        one thread rename another's ETag onto the skill content.
+        """
+        cache_file = _disk_skill_file(tmp_path, "owner/repo", "main", "SKILL.md", "token")
+
+        with patch("cletus_code.skills.loader.os.replace", wraps=os.replace) as mock_replace:
+            loader._write_disk_skill(cache_file, "first skill", '"v1"')
+            loader._write_disk_skill(cache_file, "second skill", '"v2"')
+
+        sources = [call.args[0] for call in mock_replace.call_args_list]
+        assert len(sources) == 4
+        assert len(set(sources)) == 4
+        assert cache_file.read_text() == "second skill"
+        assert cache_file.with_suffix(".etag").read_text() == '"v2"'
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github_conditional")
+    def test_fresh_disk_copy_used_without_request(self, mock_fetch: Mock, tmp_path: Path):
+        """Test that a disk copy within the TTL is served without a request."""
+        cache_file = _disk_skill_file(tmp_path, "owner/repo", "main", "SKILL.md", "token")
+        loader._write_disk_skill(cache_file, "cached skill", '"v1"')
+
+        assert _cached_fetch("owner/repo", "SKILL.md", "token", "main", tmp_path) == "cached skill"
+
+        mock_fetch.assert_not_called()
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github_conditional")
+    def test_stale_copy_revalidated_by_etag(self, mock_fetch: Mock, tmp_path: Path):
+        """Test that a 304 answer keeps the stale copy and restarts its TTL."""
+        cache_file = _disk_skill_file(tmp_path, "owner/repo", "main", "SKILL.md", "token")
+        loader._write_disk_skill(cache_file, "cached skill", '"v1"')
+        old = cache_file.stat().st_mtime - 3600
+        os.utime(cache_file, (old, old))
+        mock_fetch.return_value = (304, None, None)
+
+        assert _cached_fetch("owner/repo", "SKILL.md", "token", "main", tmp_path) == "cached skill"
+
+        assert mock_fetch.call_args.args[4] == '"v1"'
+        assert cache_file.stat().st_mtime > old
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github_conditional")
+    def test_changed_skill_replaces_disk_copy(self, mock_fetch: Mock, tmp_path: Path):
+        """Test that new content and its ETag replace the stale copy."""
+        cache_file = _disk_skill_file(tmp_path, "owner/repo", "main", "SKILL.md", "token")
+        loader._write_disk_skill(cache_file, "cached skill", '"v1"')
+        old = cache_file.stat().st_mtime - 3600
+        os.utime(cache_file, (old, old))
+        mock_fetch.return_value = (200, '"v2"', "new skill")
+
+        assert _cached_fetch("owner/repo", "SKILL.md", "token", "main", tmp_path) == "new skill"
+
+        assert cache_file.read_text() == "new skill"
+        assert cache_file.with_suffix(".etag").read_text() == '"v2"'
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github_conditional")
+    def test_other_token_does_not_read_cached_copy(self, mock_fetch: Mock, tmp_path: Path):
+        """Test that a skill cached for one token is fetched again for another."""
+        mock_fetch.return_value = (200, '"v1"', "private skill")
+        assert _cached_fetch("owner/repo", "SKILL.md", "token-a", "main", tmp_path) == "private skill"
+
+        mock_fetch.return_value = (404, None, None)
+        assert _cached_fetch("owner/repo", "SKILL.md", "token-b", "main", tmp_path) is None
+        assert mock_fetch.call_args.args[4] is None  # no ETag borrowed from the other token
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github_conditional")
+    def test_deleted_skill_is_not_served_stale(self, mock_fetch: Mock, tmp_path: Path):
+        """Test that a 404 drops the stale copy instead of serving it."""
+        cache_file = _disk_skill_file(tmp_path, "owner/repo", "main", "SKILL.md", "token")
+        loader._write_disk_skill(cache_file, "old skill", '"v1"')
+        with patch("cletus_code.skills.loader._GITHUB_SKILL_TTL", 0.0):
+            mock_fetch.return_value = (404, None, None)
+
+            assert _cached_fetch("owner/repo", "SKILL.md", "token", "main", tmp_path) is None
+
+        assert not cache_file.exists()
+        assert not cache_file.with_suffix(".etag").exists()
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github_conditional")
+    def test_failed_fetch_serves_stale_copy(self, mock_fetch: Mock, tmp_path: Path):
+        """Test that a failed refetch still serves the stale copy."""
+        cache_file = _disk_skill_file(tmp_path, "owner/repo", "main", "SKILL.md", "token")
+        loader._write_disk_skill(cache_file, "old skill", '"v1"')
+        with patch("cletus_code.skills.loader._GITHUB_SKILL_TTL", 0.0):
+            mock_fetch.return_value = (502, None, None)
+
+            assert _cached_fetch("owner/repo", "SKILL.md", "token", "main", tmp_path) == "old skill"
+
+        assert cache_file.exists()
+
+
+class TestPrefetchGithubSkills:
+    """Tests for batching GitHub skills from one repository into one query."""
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github")
+    @patch("cletus_code.skills.loader.fetch_files_from_github")
+    def test_same_repository_fetched_in_one_query(
+        self, mock_batch: Mock, mock_fetch: Mock, skill_loader: SkillLoader
+    ):
+        """Test that skills sharing a repository come from a single GraphQL query."""
+        mock_batch.return_value = ["first skill", "second skill"]
+
+        combined = skill_loader.load_skills(["owner/skills:review", "owner/skills:v1:security"])
+
+        mock_batch.assert_called_once_with(
+            "owner/skills",
+            [("main", "review/SKILL.md"), ("v1", "security/SKILL.md")],
+            skill_loader.github_token,
+        )
+        mock_fetch.assert_not_called()
+        assert "first skill" in combined
+        assert "second skill" in combined
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github")
+    @patch("cletus_code.skills.loader.fetch_files_from_github")
+    def test_batch_misses_and_failures_fetched_per_file(
+        self, mock_batch: Mock, mock_fetch: Mock, skill_loader: SkillLoader
+    ):
+        """Test that files the batch did not return, and single-file repositories, go per file."""
+        mock_batch.return_value = ["first skill", None]
+        mock_fetch.return_value = "fetched skill"
+
+        skill_loader.load_skills(["owner/skills:review", "owner/skills:security", "other/repo:lint"])
+
+        mock_batch.assert_called_once()
+        fetched = sorted(call.kwargs["path"] for call in mock_fetch.call_args_list)
+        assert fetched == ["lint/SKILL.md", "security/SKILL.md"]
+
+    @patch("cletus_code.skills.loader.fetch_file_from_github", return_value="fetched skill")
+    @patch("cletus_code.skills.loader.fetch_files_from_github", return_value=None)
+    def test_failed_batch_falls_back_to_per_file(
+        self, mock_batch: Mock, mock_fetch: Mock, skill_loader: SkillLoader
+    ):
+        """Test that a failed query leaves every file to the per-file fetch."""
+        skill_loader.load_skills(["owner/skills:review", "owner/skills:security"])
+
+        assert mock_fetch.call_count == 2
+
+
+class TestHttpSession:
+    """Tests for the pooled session used by URL skills."""
+
+    def test_session_shared(self):
+        """Test that every URL fetch reuses one pooled session."""
+        session = _http_session()
+
+        assert _http_session() is session
+        assert session.get_adapter("https://example.com")._pool_maxsize == loader._MAX_SKILL_WORKERS
+
+    @patch("cletus_code.skills.loader._http_session")
+    def test_load_url_uses_session(self, mock_session: Mock, skill_loader: SkillLoader):
+        """Test that URL skills are fetched through the session with a timeout."""
+        mock_session.return_value.get.return_value.content = "url skill".encode()
+
+        content = skill_loader._load_url("https://example.com/SKILL.md")
+
+        assert content == "url skill"
+        mock_session.return_value.get.assert_called_once_with(
+            "https://example.com/SKILL.md", timeout=loader._URL_SKILL_TIMEOUT
+        )
+
+    @patch("cletus_code.skills.loader._http_session")
+    def test_load_url_error_returns_none(self, mock_session: Mock, skill_loader: SkillLoader):
+        """Test that HTTP errors are reported as a missing skill."""
+        mock_session.return_value.get.return_value.raise_for_status.side_effect = Exception("404")
+
+        assert skill_loader._load_url("https://example.com/SKILL.md") is None
+
+
+class TestParseSkillSpec:
+    """Tests for skill spec parsing."""
+
+    @pytest.mark.parametrize(
+        "spec, expected",
+        [
+            ("owner/repo:skills/review", "github:owner/repo:main:skills/review"),
+            ("owner/repo:v1:skills/review", "github:owner/repo:v1:skills/review"),
+            ("owner/repo:skills/x:y", "github:owner/repo:main:skills/x:y"),
+            ("github:owner/repo:main:skills/a", "github:owner/repo:main:skills/a"),
+            ("my.org/repo:skills/review", "local:my.org/repo:skills/review"),
+            ("owner/repo", "local:owner/repo"),
+            ("plain-skill", "local:plain-skill"),
+            ("pr-review-toolkit", "builtin:pr-review-toolkit"),
+            ("https://example.com/SKILL.md", "url:https://example.com/SKILL.md"),
+        ],
+    )
+    def test_parse_spec(self, skill_loader: SkillLoader, spec: str, expected: str):
+        """Test how specs map to sources, including GitHub refs and dotted hosts."""
+        assert str(skill_loader._parse_skill_spec(spec)) == expected
+
+
+class TestLoadSkills:
+    """Tests for combining skills."""
+
+    def test_default_skills_built_once(self, workspace: Path, github_token: str):
+        """Test that the default skill text is shared by every loader."""
+        first = SkillLoader(workspace, "owner/repo", github_token).load_skills()
+
+        with patch.object(SkillLoader, "_combine_skills") as mock_combine:
+            second = SkillLoader(workspace, "other/repo", github_token).load_skills()
+
+        mock_combine.assert_not_called()
+        assert second is first
+        assert DEFAULT_PR_REVIEW_SKILL in first
+
+    def test_duplicate_specs_loaded_once(self, skill_loader: SkillLoader):
+        """Test that one skill spelled two ways is included once."""
+        combined = skill_loader.load_skills(["builtin:pr-review-toolkit", "pr-review-toolkit"])
+
+        assert combined.count(DEFAULT_PR_REVIEW_SKILL) == 1
+
+    @pytest.mark.parametrize(
+        "specs",
+        [
+            ["owner/repo:skills/a", "github:owner/repo:main:skills/a"],
+            ["owner/repo:skills/a", "owner/repo:skills/a/SKILL.md"],
+            ["owner/repo:skills/a/SKILL.md", "github:owner/repo:main:skills/a"],
+        ],
+    )
+    @patch("cletus_code.skills.loader.fetch_file_from_github", return_value="remote guidance")
+    def test_duplicate_github_specs_fetched_once(self, mock_fetch: Mock, skill_loader: SkillLoader, specs: list[str]):
+        """Test that specs resolving to the same GitHub file are loaded once."""
+        combined = skill_loader.load_skills(specs)
+
+        mock_fetch.assert_called_once()
+        assert combined.count("remote guidance") == 1
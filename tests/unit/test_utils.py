@@ -0,0 +1,114 @@
+"""Unit tests for utils module."""
+
+import re
+
+import pytest
+
+from cletus_code.utils import normalize_risk, risk_sort_key, slugify, truncate
+
+
+def _reference_truncate(text: str, limit: int = 300) -> str:
+    """truncate as it was before it stopped stripping a full copy of the text."""
+    text = (text or "").strip()
+    if len(text) <= limit:
+        return text
+    return text[: limit - 3] + "..."
+
+
+def _reference_risk_sort_key(value: str | None) -> int:
+    """risk_sort_key as it was before the spelling lookup table."""
+    priorities = {"HIGH": 0, "MEDIUM": 1, "LOW": 2, "UNKNOWN": 3}
+    return priorities.get(normalize_risk(value), len(priorities))
+
+
+def _reference_slugify(text: str, fallback: str) -> str:
+    """slugify as it was before the ASCII translate fast path."""
+    normalized = (text or "").strip().lower()
+    slug = re.sub(r"[^a-z0-9]+", "-", normalized).strip("-")
+    return slug or fallback
+
+
+class TestTruncate:
+    """Tests for truncate function."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            None,
+            "   ",
+            "short",
+            "x" * 10,
+            "x" * 11,
+            "  " + "x" * 10 + "  ",
+            "  " + "x" * 11,
+            "x" * 10 + "   ",
+            "x" * 9 + "  y",
+            "\n\t" + "x" * 8 + " \t" + "y",
+            "abc   def   ghi",
+            " " * 20 + "x",
+            "x" + " " * 20,
+        ],
+    )
+    @pytest.mark.parametrize("limit", [0, 1, 2, 3, 4, 10])
+    def test_matches_reference(self, text: str, limit: int):
+        """Test that truncate matches the strip-first implementation around the limit."""
+        assert truncate(text, limit) == _reference_truncate(text, limit)
+
+    def test_default_limit(self):
+        """Test truncation at the default limit of 300 characters."""
+        result = truncate("  " + "x" * 400)
+
+        assert len(result) == 300
+        assert result.endswith("...")
+
+
+class TestRiskSortKey:
+    """Tests for risk_sort_key function."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [None, "", "HIGH", "high", "High", "hIgH", "MEDIUM", "medium", "Low", "UNKNOWN", "unknown", "CRITICAL", "n/a"],
+    )
+    def test_matches_reference(self, value: str | None):
+        """Test that the lookup table agrees with normalizing every value."""
+        assert risk_sort_key(value) == _reference_risk_sort_key(value)
+
+    def test_sort_order(self):
+        """Test that higher risk sorts first and unknown values sort last."""
+        values = ["low", None, "CRITICAL", "High", "medium"]
+
+        assert sorted(values, key=risk_sort_key) == ["High", "medium", "low", None, "CRITICAL"]
+
+
+class TestSlugify:
+    """Tests for slugify function."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Deployment/default/web",
+            "  Leading and trailing  ",
+            "Already-a-slug",
+            "under_score & symbols!",
+            "Café crème",
+            "Straße",
+            "İstanbul",
+            "日本語",
+            "emoji 🚀 launch",
+            "non breaking space",
+            "!!!",
+            "---",
+            "  ",
+            "",
+            None,
+        ],
+    )
+    def test_matches_reference(self, text: str):
+        """Test that the ASCII fast path and the regex path match the old regex-only slug."""
+        assert slugify(text, "fallback") == _reference_slugify(text, "fallback")
+
+    @pytest.mark.parametrize("text", ["!!!", "日本語", "", None])
+    def test_fallback(self, text: str):
+        """Test that input without ASCII letters or digits falls back."""
+        assert slugify(text, "finding") == "finding"